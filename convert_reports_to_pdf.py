@@ -1,5 +1,8 @@
 import os
-from docx2pdf import convert
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from shutil import which
 
 # Define the directory where your .docx reports are located
@@ -8,12 +11,29 @@ REPORTS_DIR = "./reports"
 PDF_REPORTS_DIR = "./pdf_reports"
 
 # --- IMPORTANT: Configure LibreOffice executable path for Linux ---
-# This path should now be supported by an upgraded docx2pdf.
-# Try to auto-detect first.
+# soffice is invoked directly in headless mode. Try to auto-detect first.
 LIBREOFFICE_PATH = which("soffice") or "/usr/bin/soffice"
 # If 'soffice' isn't found by 'which', you might need to manually set it like:
 # LIBREOFFICE_PATH = "/opt/libreoffice7.6/program/soffice" # Example for a specific LibreOffice version
 
+# Number of soffice processes run in parallel. LibreOffice allows only one instance per user
+# profile, so every worker gets its own profile directory. Lower this if memory is tight.
+CONVERSION_WORKERS = os.cpu_count() or 1
+
+def convert_batch(profile_root, worker_id, docx_files):
+    # One soffice run per worker converts its whole batch. Profiles live in a private directory
+    # created for this run, so concurrent runs and other users never share or plant a profile.
+    profile_dir = Path(profile_root) / f"profile_{worker_id}"
+    subprocess.run(
+        [LIBREOFFICE_PATH, "--headless", f"-env:UserInstallation={profile_dir.as_uri()}",
+         "--convert-to", "pdf", "--outdir", PDF_REPORTS_DIR, *docx_files],
+        check=True
+    )
+
+# soffice names each output after its input, with the extension replaced, inside --outdir
+def pdf_path_for(docx_file_path):
+    return os.path.join(PDF_REPORTS_DIR, Path(docx_file_path).stem + ".pdf")
+
 if __name__ == "__main__":
     # Ensure the PDF output directory exists
     os.makedirs(PDF_REPORTS_DIR, exist_ok=True)
@@ -26,24 +46,47 @@ if __name__ == "__main__":
         print("Please ensure LibreOffice is installed and update 'LIBREOFFICE_PATH' in the script to its correct location.")
         exit(1) # Exit if LibreOffice is not found
 
-    # Iterate through all files in the reports directory
-    for filename in os.listdir(REPORTS_DIR):
-        if filename.endswith(".docx"):
-            docx_file_path = os.path.join(REPORTS_DIR, filename)
-            pdf_filename = filename.replace(".docx", ".pdf")
-            pdf_file_path = os.path.join(PDF_REPORTS_DIR, pdf_filename)
+    with os.scandir(REPORTS_DIR) as it:
+        docx_files = [entry.path for entry in it if entry.name.endswith(".docx") and entry.is_file(follow_symlinks=False)]
 
+    # Split the files into one batch per worker: LibreOffice startup dominates the cost of each
+    # conversion, so every soffice process converts a whole batch with --outdir, and the batches
+    # run concurrently with separate user profiles.
+    if docx_files:
+        # PDFs left over from an earlier run are removed first, so an existing PDF afterwards means this
+        # run produced it; no file timestamps are compared
+        for docx_file_path in docx_files:
             try:
-                print(f"Converting '{filename}' to PDF using executable '{LIBREOFFICE_PATH}'...")
-                # Pass the executable path to the convert function
-                convert(docx_file_path, pdf_file_path, executable=LIBREOFFICE_PATH)
-                print(f"Successfully converted '{filename}' to '{pdf_filename}'.")
-            except Exception as e:
-                print(f"Error converting '{filename}': {e}")
-                print("This usually means LibreOffice encountered an issue during conversion.")
+                os.remove(pdf_path_for(docx_file_path))
+            except FileNotFoundError:
+                pass
+        n_workers = max(1, min(CONVERSION_WORKERS, len(docx_files)))
+        batches = [docx_files[i::n_workers] for i in range(n_workers)]
+        print(f"Converting {len(docx_files)} file(s) to PDF with {n_workers} LibreOffice process(es) using executable '{LIBREOFFICE_PATH}'...")
+        with tempfile.TemporaryDirectory(prefix="ux4ai_lo_") as profile_root, ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(convert_batch, profile_root, worker_id, batch) for worker_id, batch in enumerate(batches)]
+            for worker_id, (future, batch) in enumerate(zip(futures, batches)):
+                try:
+                    future.result()
+                except (subprocess.CalledProcessError, OSError) as e:
+                    print(f"Error running LibreOffice for batch {worker_id}: {e}")
+                    print("This usually means LibreOffice encountered an issue during conversion.")
+                missing = [os.path.basename(docx_file_path) for docx_file_path in batch if not os.path.exists(pdf_path_for(docx_file_path))]
+                if missing:
+                    print(f"Batch {worker_id}: no PDF produced for {', '.join(missing)}")
+
+        for docx_file_path in docx_files:
+            filename = os.path.basename(docx_file_path)
+            pdf_file_path = pdf_path_for(docx_file_path)
+            if os.path.exists(pdf_file_path):
+                print(f"Successfully converted '{filename}' to '{os.path.basename(pdf_file_path)}'.")
+            else:
+                print(f"Error converting '{filename}'.")
                 print("Check the .docx file for corruption or complex elements that LibreOffice might struggle with.")
                 print(f"Ensure LibreOffice can open '{docx_file_path}' manually without errors.")
     
     print("Conversion process finished.")
-    if not os.listdir(PDF_REPORTS_DIR):
+    with os.scandir(PDF_REPORTS_DIR) as it:
+        pdf_generated = any(it)
+    if not pdf_generated:
         print("No PDF files were generated. Check for errors above or ensure .docx files exist in the reports directory.")
\ No newline at end of file
@@ -1,122 +1,444 @@
 import gradio as gr
 import plotly.graph_objects as go
+import numpy as np
+import functools
 import json
+import mmap
 import os
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from ux4ai_common import json_dumps, json_loads, write_file_atomic
+
+# Files above this size are parsed straight from a read-only memory map instead of a read() copy.
+# Only orjson/msgspec accept the mapped buffer; the stdlib parser keeps reading bytes.
+MMAP_MIN_SIZE = 64 * 1024
+_MMAP_LOADS = json_loads is not json.loads
+
+def _loads_mapped(f, loads):
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return loads(view)
 
 # --- Language setup ---
 LANG_DIR = "./lang"
 DEFAULT_LANG = "en"
 
+# Each language file is parsed at most once per (path, mtime), so switching languages is a cache hit
+# while edits to a language file are still picked up.
+@functools.lru_cache(maxsize=8)
+def _load_lang_cached(file_path, mtime_ns):
+    with open(file_path, "rb") as f:
+        return json_loads(f.read())
+
 def load_lang_file(lang_code):
-    file_path = os.path.join(LANG_DIR, f"{lang_code}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Language file not found for '{lang_code}'. Falling back to default.")
-        return load_lang_file(DEFAULT_LANG)
-    except json.JSONDecodeError:
-        print(f"Error decoding JSON for '{lang_code}', falling back to default.")
-        return load_lang_file(DEFAULT_LANG)
+    # Try the requested language, then the default once; a broken default must not recurse forever.
+    for code in dict.fromkeys((lang_code, DEFAULT_LANG)):
+        file_path = os.path.join(LANG_DIR, f"{code}.json")
+        try:
+            return _load_lang_cached(file_path, os.stat(file_path).st_mtime_ns)
+        except FileNotFoundError:
+            print(f"Warning: Language file not found for '{code}'. Falling back to default.")
+        except json.JSONDecodeError:
+            print(f"Error decoding JSON for '{code}', falling back to default.")
+    return {}
 
 LANG = load_lang_file(DEFAULT_LANG)
 
 DATA_DIR = "./data"
 SOLUTION_DIR = "./solutions"
 
-def load_and_process_data():
-    if not os.path.exists(DATA_DIR):
-        print(f"Warning: Data directory '{DATA_DIR}' not found.")
-        return {}
+SCORE_KEYS = ('conversational', 'specialization', 'autonomy', 'accessibility', 'explainability')
+
+# Per-file records keyed by path -> (st_mtime_ns, st_size, record).
+# Unchanged files are not re-read on refresh; entries for deleted files are pruned after each walk.
+_PARSE_CACHE = {}
+
+# The parse cache is persisted outside the data directory, so a restart only re-reads files changed meanwhile.
+# The header ties it to the record layout: bump MANIFEST_VERSION when _extract_record changes shape.
+CACHE_DIR = "./cache"
+MANIFEST_PATH = os.path.join(CACHE_DIR, "dashboard_manifest.json")
+MANIFEST_VERSION = 2
+_MANIFEST_STATE = {"loaded": False}
+
+def _manifest_header():
+    return {"version": MANIFEST_VERSION, "score_keys": list(SCORE_KEYS), "data_dir": os.path.abspath(DATA_DIR)}
+
+def _parse_manifest_entry(entry):
+    mtime_ns, size, record = entry
+    if not isinstance(mtime_ns, int) or not isinstance(size, int):
+        raise ValueError("bad stat fields")
+    if record:
+        product_name, scores, ai_role, risk_level, analytics_level = record
+        scores = tuple(float(score) for score in scores)
+        if not isinstance(product_name, str) or len(scores) not in (0, len(SCORE_KEYS)):
+            raise ValueError("bad record")
+        record = (product_name, scores, ai_role, float(risk_level), float(analytics_level))
+    return mtime_ns, size, record
+
+def _load_manifest():
+    # Anything unexpected discards the whole manifest; the walk then re-reads every file
+    try:
+        with open(MANIFEST_PATH, "rb") as f:
+            manifest = json_loads(f.read())
+        if manifest.get("header") != _manifest_header():
+            return
+        entries = {file_path: _parse_manifest_entry(entry) for file_path, entry in manifest["entries"].items()}
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        print(f"Ignoring unusable cache manifest {MANIFEST_PATH}: {e}")
+        return
+    _PARSE_CACHE.update(entries)
 
-    aggregated_data = defaultdict(lambda: {
-        "scores": defaultdict(float),
-        "count": 0,
-        "risk_level_sum": 0.0,
-        "analytics_level_sum": 0.0,
-        "ai_role_counts": defaultdict(int)
-    })
-
-    for root, _, files in os.walk(DATA_DIR):
-        for filename in files:
-            if filename.endswith(".json"):
-                file_path = os.path.join(root, filename)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        product_name = data.get("product_name")
-                        if not product_name:
-                            continue
-
-                        agg = aggregated_data[product_name]
-                        agg["count"] += 1
-
-                        if data.get("scores"):
-                            for key, value in data["scores"].items():
-                                agg["scores"][key] += value
-
-                        if data.get("ai_role"):
-                            agg["ai_role_counts"][data["ai_role"]] += 1
-
-                        if data.get("risk_of_adversarial_attacks"):
-                            agg["risk_level_sum"] += data["risk_of_adversarial_attacks"].get("level", 0.0)
-
-                        if data.get("continuous_learning_feedback_loops"):
-                            agg["analytics_level_sum"] += data["continuous_learning_feedback_loops"].get("analytics_type_level", 0.0)
-
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Error reading {file_path}: {e}")
-
-    processed_data = {}
-    for product, data in aggregated_data.items():
-        count = data["count"]
-        if count > 0:
-            processed_data[product] = {
-                "count": count,
-                "avg_scores": {k: total / count for k, total in data["scores"].items()},
-                "ai_role_counts": dict(data["ai_role_counts"]),
-                "avg_risk_level": data["risk_level_sum"] / count,
-                "avg_analytics_level": data["analytics_level_sum"] / count
-            }
-    return processed_data
+def _save_manifest():
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_file_atomic(MANIFEST_PATH, json_dumps({"header": _manifest_header(), "entries": _PARSE_CACHE}))
+    except OSError as e:
+        print(f"Could not write cache manifest {MANIFEST_PATH}: {e}")
+
+def _extract_record(data):
+    # Reduce a submission to the fields the dashboard aggregates:
+    # (product_name, scores in SCORE_KEYS order or () when unscored, ai_role, risk level, analytics level)
+    product_name = data.get("product_name")
+    if not product_name:
+        return None
+    scores = data.get("scores")
+    risk_info = data.get("risk_of_adversarial_attacks") or {}
+    learning_info = data.get("continuous_learning_feedback_loops") or {}
+    return (
+        product_name,
+        tuple(scores.get(key, 0.0) for key in SCORE_KEYS) if scores else (),
+        data.get("ai_role"),
+        risk_info.get("level", 0.0),
+        learning_info.get("analytics_type_level", 0.0)
+    )
 
-def load_solution_data(product_name):
-    safe_filename = product_name.lower().replace(" ", "_").replace("/", "_") + ".json"
-    solution_path = os.path.join(SOLUTION_DIR, safe_filename)
-    if os.path.exists(solution_path):
+# With msgspec installed, submissions are decoded straight into typed structs holding only the
+# aggregated fields; the long free-text entries are skipped by the decoder instead of materialized.
+try:
+    import msgspec
+
+    class _Risk(msgspec.Struct):
+        level: float = 0.0
+
+    class _Learning(msgspec.Struct):
+        analytics_type_level: float = 0.0
+
+    class _Report(msgspec.Struct):
+        product_name: str | None = None
+        scores: dict[str, float] | None = None
+        ai_role: str | None = None
+        risk_of_adversarial_attacks: _Risk | None = None
+        continuous_learning_feedback_loops: _Learning | None = None
+
+    _report_decoder = msgspec.json.Decoder(_Report)
+    _RECORD_ERRORS = (json.JSONDecodeError, IOError, msgspec.DecodeError)
+
+    def _decode_record(buf):
+        report = _report_decoder.decode(buf)
+        if not report.product_name:
+            return None
+        scores = report.scores
+        risk_info = report.risk_of_adversarial_attacks
+        learning_info = report.continuous_learning_feedback_loops
+        return (
+            report.product_name,
+            tuple(scores.get(key, 0.0) for key in SCORE_KEYS) if scores else (),
+            report.ai_role,
+            risk_info.level if risk_info else 0.0,
+            learning_info.analytics_type_level if learning_info else 0.0
+        )
+except ImportError:
+    # ValueError also covers documents that parse but are not an object
+    _RECORD_ERRORS = (ValueError, IOError)
+
+    def _decode_record(buf):
+        data = json_loads(buf)
+        if not isinstance(data, dict):
+            raise ValueError("not a JSON object")
+        return _extract_record(data)
+
+# Files that missed the parse cache are read on a small thread pool; file reads release the GIL,
+# so disk latency overlaps while aggregation itself stays on the calling thread.
+_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_PARSE_LOCK = threading.Lock()
+
+# Large files (e.g. aggregated dumps) are streamed with ijson when it is installed, picking out only
+# the aggregated fields instead of materializing the whole document. Streaming is slower for small
+# files, so it is gated on size.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+STREAM_MIN_SIZE = 256 * 1024
+_STREAM_PREFIXES = frozenset(("product_name", "ai_role", "risk_of_adversarial_attacks.level",
+                              "continuous_learning_feedback_loops.analytics_type_level",
+                              *(f"scores.{key}" for key in SCORE_KEYS)))
+
+def _stream_record(f):
+    fields = {}
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix in _STREAM_PREFIXES and event in ("string", "number"):
+            fields[prefix] = value
+    if not fields.get("product_name"):
+        return None
+    return (
+        fields["product_name"],
+        tuple(fields.get(f"scores.{key}", 0.0) for key in SCORE_KEYS) if any(f"scores.{key}" in fields for key in SCORE_KEYS) else (),
+        fields.get("ai_role"),
+        fields.get("risk_of_adversarial_attacks.level", 0.0),
+        fields.get("continuous_learning_feedback_loops.analytics_type_level", 0.0)
+    )
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+def _read_record(file_path):
+    try:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # Peek first: empty files and non-object documents are rejected without invoking the parser.
+            # A leading UTF-8 BOM is skipped; a header that is all whitespace leaves the decision to the parser.
+            header = f.read(4096)
+            if header.startswith(_UTF8_BOM):
+                return _decode_record(header[len(_UTF8_BOM):] + f.read()), None
+            first_byte = header.lstrip()[:1]
+            if not first_byte and size <= len(header):
+                return None, ValueError("empty file")
+            if first_byte and first_byte != b"{":
+                return None, ValueError("not a JSON object")
+            if ijson is not None and size > STREAM_MIN_SIZE:
+                f.seek(0)
+                try:
+                    return _stream_record(f), None
+                except ijson.JSONError:
+                    # Let the regular parser decide whether the file is really malformed
+                    f.seek(0)
+                    header = b""
+            if _MMAP_LOADS and size > MMAP_MIN_SIZE:
+                return _loads_mapped(f, _decode_record), None
+            return _decode_record(header + f.read()), None
+    except _RECORD_ERRORS as e:
+        return None, e
+
+def _iter_json(path):
+    # Iterative scandir walk yielding (path, stat); DirEntry objects carry the stat obtained while listing.
+    # Like os.walk, symlinked directories are not descended into, while symlinked files are read.
+    # Like os.walk's default, unreadable directories and entries (removed mid-walk, no permission, ...)
+    # are skipped; only a failing root raises.
+    pending = [path]
+    while pending:
+        dir_path = pending.pop()
         try:
-            with open(solution_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading solution file {solution_path}: {e}")
-    return None
+            it = os.scandir(dir_path)
+        except OSError:
+            if dir_path == path:
+                raise
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not (entry.name.endswith(".json") and entry.is_file()):
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield entry.path, st
+
+def _aggregate_records(records):
+    if not records:
+        return {}
 
-def create_spider_diagram_plotly(avg_scores, solution_scores=None, lang_dict=LANG):
-    labels = ['conversational', 'specialization', 'autonomy', 'accessibility', 'explainability']
-    theta = [lang_dict[label + "_label"].split('(')[0].strip() for label in labels]
-    fig = go.Figure()
+    # Aggregate into per-product columns (struct-of-arrays): one row per product, indexed through
+    # product_index, so sums and averages are single vectorized operations instead of per-key dict updates.
+    product_index = {}
+    product_ids = np.fromiter((product_index.setdefault(record[0], len(product_index)) for record in records),
+                              dtype=np.intp, count=len(records))
+    n_products = len(product_index)
+    counts = np.bincount(product_ids, minlength=n_products)
+    # Weighted bincount per score column; np.add.at is an unbuffered per-element loop and much slower.
+    # Unscored submissions add zero rows but still count towards the average, as before; products
+    # without any scored submission get no average scores at all (scored == 0).
+    unscored_row = (0.0,) * len(SCORE_KEYS)
+    score_matrix = np.array([record[1] or unscored_row for record in records], dtype=np.float64)
+    scored = np.bincount(product_ids, weights=[bool(record[1]) for record in records], minlength=n_products)
+    score_sums = np.column_stack([np.bincount(product_ids, weights=score_matrix[:, k], minlength=n_products)
+                                  for k in range(len(SCORE_KEYS))])
+    risk_sums = np.bincount(product_ids, weights=[record[3] for record in records], minlength=n_products)
+    analytics_sums = np.bincount(product_ids, weights=[record[4] for record in records], minlength=n_products)
+    ai_role_counts = Counter((product_id, record[2]) for product_id, record in zip(product_ids.tolist(), records) if record[2])
+
+    # The result stays columnar: one row per product, looked up by name through `index`.
+    # Every callback receives this same small set of arrays instead of a nested dict per product.
+    role_names = sorted({role for _, role in ai_role_counts})
+    role_columns = {role: np.zeros(n_products, dtype=np.int64) for role in role_names}
+    for (product_id, role), n in ai_role_counts.items():
+        role_columns[role][product_id] = n
+
+    return {
+        "products": sorted(product_index),  # sorted once here; dropdowns and overview use it as-is
+        "index": product_index,
+        "counts": counts,
+        "avg_scores": score_sums / counts[:, None],
+        "scored": scored,
+        "avg_risk": risk_sums / counts,
+        "avg_analytics": analytics_sums / counts,
+        "ai_role_counts": role_columns
+    }
+
+def _product_view(all_data, product_name):
+    # Per-product row of the columnar result, in the shape the display code reads
+    idx = all_data.get("index", {}).get(product_name) if all_data else None
+    if idx is None:
+        return {}
+    return {
+        "count": int(all_data["counts"][idx]),
+        "avg_scores": dict(zip(SCORE_KEYS, all_data["avg_scores"][idx].tolist())) if all_data["scored"][idx] else {},
+        "ai_role_counts": {role: int(column[idx]) for role, column in all_data["ai_role_counts"].items() if column[idx]},
+        "avg_risk_level": float(all_data["avg_risk"][idx]),
+        "avg_analytics_level": float(all_data["avg_analytics"][idx])
+    }
+
+# Last aggregated result, returned as-is while no data file was added, changed or removed
+_PROCESSED_CACHE = {"value": None, "checked_at": 0.0}
+# Calls arriving within this many seconds of the last disk scan reuse its result without rescanning,
+# unless force is set. Either way files are only re-parsed when their (mtime, size) changed.
+_REFRESH_MIN_INTERVAL = 0.5
+
+def load_and_process_data(force=False):
+    if not force and _PROCESSED_CACHE["value"] is not None and time.monotonic() - _PROCESSED_CACHE["checked_at"] < _REFRESH_MIN_INTERVAL:
+        return _PROCESSED_CACHE["value"]
+
+    # No separate existence check: a missing data directory surfaces as the walk's first scandir failing
+    try:
+        file_stats = dict(_iter_json(DATA_DIR))
+    except FileNotFoundError:
+        print(f"Warning: Data directory '{DATA_DIR}' not found.")
+        return {}
+    except OSError as e:
+        print(f"Warning: Data directory '{DATA_DIR}' cannot be read: {e}")
+        return {}
 
-    # Create a closed loop for the spider chart by repeating the first value and label
-    theta_closed = theta + [theta[0]]
+    # Gradio runs handlers on worker threads; serialize access to the shared parse cache
+    with _PARSE_LOCK:
+        if not _MANIFEST_STATE["loaded"]:
+            _load_manifest()
+            _MANIFEST_STATE["loaded"] = True
+
+        cache_changed = False
+        missing_paths = []
+        for file_path, st in file_stats.items():
+            cached = _PARSE_CACHE.get(file_path)
+            if not cached or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+                missing_paths.append(file_path)
+
+        if missing_paths:
+            # Errors are collected and printed in one write, so a directory full of broken files
+            # doesn't pay a separate stdout write per file
+            errors = []
+            with ThreadPoolExecutor(max_workers=min(_PARSE_WORKERS, len(missing_paths))) as executor:
+                for file_path, (record, error) in zip(missing_paths, executor.map(_read_record, missing_paths)):
+                    if error is not None:
+                        errors.append(f"Error reading {file_path}: {error}")
+                        if _PARSE_CACHE.pop(file_path, None) is not None:
+                            cache_changed = True
+                        continue
+                    st = file_stats[file_path]
+                    _PARSE_CACHE[file_path] = (st.st_mtime_ns, st.st_size, record)
+                    cache_changed = True
+            if errors:
+                print("\n".join(errors))
+
+        stale_paths = _PARSE_CACHE.keys() - file_stats.keys()
+        for stale_path in stale_paths:
+            del _PARSE_CACHE[stale_path]
+        if cache_changed or stale_paths:
+            _save_manifest()
+
+        # Nothing on disk changed since the last call: every caller (startup, both refresh buttons)
+        # shares the previously aggregated result instead of recomputing it.
+        _PROCESSED_CACHE["checked_at"] = time.monotonic()
+        if not missing_paths and not stale_paths and _PROCESSED_CACHE["value"] is not None:
+            return _PROCESSED_CACHE["value"]
+
+        processed_data = _aggregate_records([record for _, _, record in _PARSE_CACHE.values() if record])
+        _PROCESSED_CACHE["value"] = processed_data
+        return processed_data
+
+# Keyed on the file's mtime so an edited solution file is picked up without a restart.
+@functools.lru_cache(maxsize=256)
+def _load_solution_cached(solution_path, mtime_ns):
+    try:
+        with open(solution_path, "rb") as f:
+            if _MMAP_LOADS and os.fstat(f.fileno()).st_size > MMAP_MIN_SIZE:
+                return _loads_mapped(f, json_loads)
+            return json_loads(f.read())
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error reading solution file {solution_path}: {e}")
+    return None
+
+_SAFE_FILENAME_TABLE = str.maketrans(" /", "__")
 
-    avg_values = [avg_scores.get(label.lower(), 0) for label in labels]
-    avg_values.append(avg_values[0]) # Append the first value to the end to close the shape
-    fig.add_trace(go.Scatterpolar(r=avg_values, theta=theta_closed, fill='toself', name=lang_dict["user_average_label"]))
+@functools.lru_cache(maxsize=256)
+def _solution_path(product_name):
+    return os.path.join(SOLUTION_DIR, product_name.lower().translate(_SAFE_FILENAME_TABLE) + ".json")
 
-    if solution_scores:
-        solution_values = [solution_scores.get(label.lower(), 0) for label in labels]
-        solution_values.append(solution_values[0]) # Append the first value to the end to close the shape
+def load_solution_data(product_name):
+    solution_path = _solution_path(product_name)
+    try:
+        mtime_ns = os.stat(solution_path).st_mtime_ns
+    except OSError:
+        return None
+    return _load_solution_cached(solution_path, mtime_ns)
+
+def _close(seq):
+    # Repeat the first point at the end so the polar trace forms a closed shape
+    return (*seq, seq[0])
+
+# Spider-chart axis labels depend only on the language strings, so the split/strip work and the
+# closing label are computed once per language. Keyed on the label texts themselves because
+# Gradio hands each session its own copy of the language dict.
+@functools.lru_cache(maxsize=8)
+def _theta_closed_for(label_texts):
+    return _close(tuple(text.split('(')[0].strip() for text in label_texts))
+
+def _theta_closed(lang_dict):
+    return _theta_closed_for(tuple(lang_dict[label + "_label"] for label in SCORE_KEYS))
+
+# Figures are memoized on the plotted values and label texts, so re-selecting a product or toggling
+# the solution returns the already built Figure. Callers must not mutate the returned figure.
+@functools.lru_cache(maxsize=256)
+def _spider_figure(avg_values, solution_values, theta_closed, user_label, lecturer_label):
+    # Traces are plain dicts and the figure is built with _validate=False: the inputs are small
+    # fixed-shape values, so plotly's per-property schema validation is pure overhead here.
+    traces = [{"type": "scatterpolar", "r": avg_values, "theta": theta_closed, "fill": "toself", "name": user_label}]
+    if solution_values:
         # MODIFIED: Changed name to use 'lecturer_label' and updated line color for consistency
-        fig.add_trace(go.Scatterpolar(r=solution_values, theta=theta_closed, fill='toself', name=lang_dict.get("lecturer_label", "Lecturer"), line=dict(color='green')))
+        traces.append({"type": "scatterpolar", "r": solution_values, "theta": theta_closed, "fill": "toself", "name": lecturer_label, "line": {"color": "green"}})
+
+    # Data and layout go into the constructor as one figure dict, so plotly builds the figure in a
+    # single pass instead of merging a separate update_layout call into it afterwards.
+    return go.Figure({
+        "data": traces,
+        "layout": {"polar": {"radialaxis": {"visible": True, "range": [0, 5]}}, "showlegend": True, "height": 350}
+    }, _validate=False)
 
-    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 5])), showlegend=True, height=350)
-    return fig
+def create_spider_diagram_plotly(avg_scores, solution_scores=None, lang_dict=LANG):
+    # Create a closed loop for the spider chart by repeating the first value and label
+    avg_values = _close(tuple(avg_scores.get(label, 0) for label in SCORE_KEYS))
+    solution_values = _close(tuple(solution_scores.get(label, 0) for label in SCORE_KEYS)) if solution_scores else None
+    return _spider_figure(avg_values, solution_values, _theta_closed(lang_dict),
+                          lang_dict["user_average_label"], lang_dict.get("lecturer_label", "Lecturer"))
 
 def update_visualization(selected_product, show_solution, all_data, lang_dict):
     if not selected_product or not all_data:
         return None, lang_dict["select_product_prompt"]
-    product_data = all_data.get(selected_product, {})
+    product_data = _product_view(all_data, selected_product)
     if not product_data:
         return None, lang_dict["no_data_found_for"].format(product=selected_product)
 
@@ -144,47 +466,55 @@ def update_visualization(selected_product, show_solution, all_data, lang_dict):
     fig = create_spider_diagram_plotly(product_data.get('avg_scores', {}), solution_data.get('scores') if solution_data else None, lang_dict)
     return fig, info_text
 
-def create_comparison_spider_diagram_plotly(product1, product2, show_solution, show_user_average, all_data, lang_dict):
-    labels = ['conversational', 'specialization', 'autonomy', 'accessibility', 'explainability']
-    theta = [lang_dict[label + "_label"].split('(')[0].strip() for label in labels]
+def create_comparison_spider_diagram_plotly(product1, product2, show_solution, show_user_average, all_data, lang_dict,
+                                            p1_solution_data=None, p2_solution_data=None):
     # MODIFIED: Create a closed loop for the spider chart by repeating the first label
-    theta_closed = theta + [theta[0]]
-    fig = go.Figure()
+    theta_closed = _theta_closed(lang_dict)
+    traces = []
 
     def add_trace(product_name, avg_scores, solution_scores, avg_color, sol_color):
         if show_user_average and avg_scores:
             # MODIFIED: Append the first value to the end to close the shape
-            r_avg = [avg_scores.get(lbl.lower(), 0) for lbl in labels] + [avg_scores.get(labels[0].lower(), 0)]
-            fig.add_trace(go.Scatterpolar(r=r_avg,
-                                          theta=theta_closed, fill='none', name=f"{product_name} ({lang_dict['user_average_label']})", line=dict(color=avg_color, width=3)))
+            r_avg = _close(tuple(avg_scores.get(lbl, 0) for lbl in SCORE_KEYS))
+            traces.append((r_avg, f"{product_name} ({lang_dict['user_average_label']})", avg_color, 3))
         if show_solution and solution_scores:
             # MODIFIED: Append the first value to the end to close the shape
-            r_sol = [solution_scores.get(lbl.lower(), 0) for lbl in labels] + [solution_scores.get(labels[0].lower(), 0)]
+            r_sol = _close(tuple(solution_scores.get(lbl, 0) for lbl in SCORE_KEYS))
             # MODIFIED: Renamed to 'Lecturer', removed dashed line, and updated line style
-            fig.add_trace(go.Scatterpolar(r=r_sol,
-                                          theta=theta_closed, fill='none', name=f"{product_name}", line=dict(color=sol_color, width=2)))
+            traces.append((r_sol, f"{product_name}", sol_color, 2))
 
     if product1:
-        p1_data = all_data.get(product1, {})
-        # FIX: Safely load solution data to prevent errors if the file doesn't exist
-        solution_data_p1 = load_solution_data(product1)
-        p1_sol = solution_data_p1.get('scores') if show_solution and solution_data_p1 else None
+        p1_data = _product_view(all_data, product1)
+        # Solution data is loaded by the caller; None when missing or not shown
+        p1_sol = p1_solution_data.get('scores') if show_solution and p1_solution_data else None
         # MODIFIED: Updated solution color to green for better visibility
         add_trace(product1, p1_data.get('avg_scores', {}), p1_sol, 'blue', 'green')
 
     if product2:
-        p2_data = all_data.get(product2, {})
-        # FIX: Safely load solution data
-        solution_data_p2 = load_solution_data(product2)
-        p2_sol = solution_data_p2.get('scores') if show_solution and solution_data_p2 else None
+        p2_data = _product_view(all_data, product2)
+        p2_sol = p2_solution_data.get('scores') if show_solution and p2_solution_data else None
         # MODIFIED: Updated solution color to purple for better visibility
         add_trace(product2, p2_data.get('avg_scores', {}), p2_sol, 'red', 'purple')
 
-    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 5])), showlegend=True, height=600)
-    return fig
+    return _comparison_figure(tuple(traces), theta_closed)
+
+# Comparison figures memoized on their (values, name, color, width) trace specs, so toggling a
+# checkbox back to an earlier combination reuses that figure. Callers must not mutate it.
+@functools.lru_cache(maxsize=128)
+def _comparison_figure(trace_specs, theta_closed):
+    traces = [{"type": "scatterpolar", "r": r, "theta": theta_closed, "fill": "none", "name": name, "line": {"color": color, "width": width}}
+              for r, name, color, width in trace_specs]
+    return go.Figure({
+        "data": traces,
+        "layout": {"polar": {"radialaxis": {"visible": True, "range": [0, 5]}}, "showlegend": True, "height": 600}
+    }, _validate=False)
 
 def update_comparison_visualization(p1, p2, show_solution, show_user_average, all_data, lang_dict):
-    fig = create_comparison_spider_diagram_plotly(p1, p2, show_solution, show_user_average, all_data, lang_dict)
+    # FIX: Safely load solution data to prevent errors if the file doesn't exist; skipped entirely when hidden
+    p1_solution = load_solution_data(p1) if show_solution and p1 else None
+    p2_solution = load_solution_data(p2) if show_solution and p2 else None
+    fig = create_comparison_spider_diagram_plotly(p1, p2, show_solution, show_user_average, all_data, lang_dict,
+                                                  p1_solution, p2_solution)
     info_text = "### " + lang_dict["product_comparison_label"] + "\n"
     if p1: info_text += f"- {p1}\n"
     if p2: info_text += f"- {p2}\n"
@@ -192,30 +522,81 @@ def update_comparison_visualization(p1, p2, show_solution, show_user_average, al
     if show_solution: info_text += f"- {lang_dict['showing_solution_label']}\n"
     return fig, info_text
 
-def generate_overview_plots(all_data, lang_dict):
-    figs = []
-    for product_name, product_data in all_data.items():
-        avg_scores = product_data.get('avg_scores', {})
+# Overview figures keyed by (product, averaged scores, displayed language strings).
+# Refreshes with unchanged data reuse the same Figure instead of rebuilding it; once full, the least
+# recently used entry is evicted so only products whose scores changed are rebuilt.
+# Gradio runs handlers on worker threads, so every lookup and update holds the lock.
+_OVERVIEW_FIG_CACHE = OrderedDict()
+_OVERVIEW_FIG_LOCK = threading.Lock()
+_OVERVIEW_FIG_CACHE_MAX = 256
+
+def _overview_lang_key(lang_dict):
+    return (_theta_closed(lang_dict), lang_dict['user_average_label'], lang_dict['ux4ai_analysis_label'])
+
+# The Overview tab has a fixed grid of 4 columns x 2 rows; products beyond that are not shown
+OVERVIEW_SLOTS = 8
+
+def _overview_figures(all_data, lang_dict, limit=None):
+    entries = []
+    lang_key = _overview_lang_key(lang_dict)
+    for product_name in all_data.get("products", ()):
+        if limit is not None and len(entries) >= limit:
+            break
+        avg_scores = _product_view(all_data, product_name).get('avg_scores', {})
         if avg_scores:
-            fig = create_spider_diagram_plotly(avg_scores, None, lang_dict)
-            fig.update_layout(title_text=f"{product_name} {lang_dict['ux4ai_analysis_label']}")
-            figs.append((product_name, fig))
-    return figs
-
-def refresh_data(lang_dict):
-    processed_data = load_and_process_data()
-    product_list = sorted(list(processed_data.keys()))
+            cache_key = (product_name, tuple(avg_scores.get(key, 0) for key in SCORE_KEYS), lang_key)
+            with _OVERVIEW_FIG_LOCK:
+                fig = _OVERVIEW_FIG_CACHE.get(cache_key)
+                if fig is not None:
+                    _OVERVIEW_FIG_CACHE.move_to_end(cache_key)
+            if fig is None:
+                # Copy the memoized base figure before giving it a title
+                fig = go.Figure(create_spider_diagram_plotly(avg_scores, None, lang_dict))
+                fig.update_layout(title_text=f"{product_name} {lang_dict['ux4ai_analysis_label']}")
+                with _OVERVIEW_FIG_LOCK:
+                    _OVERVIEW_FIG_CACHE[cache_key] = fig
+                    if len(_OVERVIEW_FIG_CACHE) > _OVERVIEW_FIG_CACHE_MAX:
+                        _OVERVIEW_FIG_CACHE.popitem(last=False)
+            entries.append((product_name, fig, cache_key))
+    return entries
+
+def generate_overview_plots(all_data, lang_dict):
+    return [(product_name, fig) for product_name, fig, _ in _overview_figures(all_data, lang_dict)]
+
+def overview_updates(all_data, lang_dict, emitted_keys):
+    # Always one update per slot: slots whose figure key matches what the client already shows get an
+    # empty gr.update(), slots without a scored product are hidden
+    updates, keys = [], []
+    for idx, (product_name, fig, cache_key) in enumerate(_overview_figures(all_data, lang_dict, OVERVIEW_SLOTS)):
+        unchanged = emitted_keys is not None and idx < len(emitted_keys) and emitted_keys[idx] == cache_key
+        updates.append(gr.update() if unchanged else
+                       gr.update(value=fig, visible=True, label=f"{product_name} {lang_dict['overview_label']}"))
+        keys.append(cache_key)
+    updates.extend(gr.update(value=None, visible=False) for _ in range(OVERVIEW_SLOTS - len(updates)))
+    return updates, keys
+
+def refresh_data(lang_dict, emitted_keys):
+    # An explicit refresh also drops cached solution files instead of waiting for an mtime change
+    _load_solution_cached.cache_clear()
+    processed_data = load_and_process_data(force=True)
+    product_list = processed_data.get("products", [])
     compare_plot = create_comparison_spider_diagram_plotly(None, None, False, True, processed_data, lang_dict)
-    overview_figs = [fig for _, fig in generate_overview_plots(processed_data, lang_dict)]
+    overview_figs, overview_keys = overview_updates(processed_data, lang_dict, emitted_keys)
     return (
         processed_data,
         gr.update(choices=product_list, value=None),
         *overview_figs,
         compare_plot,
         gr.update(choices=product_list),
-        gr.update(choices=product_list)
+        gr.update(choices=product_list),
+        overview_keys
     )
 
+def refresh_overview(all_data, lang_dict, emitted_keys):
+    # Rebuild from the data already held in the session; only rescan the disk if none is loaded yet
+    overview_figs, overview_keys = overview_updates(all_data or load_and_process_data(), lang_dict, emitted_keys)
+    return (*overview_figs, overview_keys)
+
 # FIXED: Button text updates use `value=` not `label=`
 def update_dashboard_lang(lang_code):
     new_lang = load_lang_file(lang_code)
@@ -239,6 +620,7 @@ with gr.Blocks(title=LANG["dashboard_title"], css=".gr-row {flex-wrap: nowrap;}
     initial_data = load_and_process_data()
     current_lang_state = gr.State(LANG)
     all_processed_data = gr.State(initial_data)
+    product_list = initial_data.get("products", [])
 
     dashboard_header_markdown = gr.Markdown(f"# {LANG['dashboard_header']}")
 
@@ -250,32 +632,37 @@ with gr.Blocks(title=LANG["dashboard_title"], css=".gr-row {flex-wrap: nowrap;}
         with gr.Row():
             with gr.Column(scale=1):
                 refresh_btn_global = gr.Button(LANG["refresh_all_data"])
-                product_dropdown = gr.Dropdown(choices=sorted(list(initial_data.keys())), label=LANG["select_product"])
+                product_dropdown = gr.Dropdown(choices=product_list, label=LANG["select_product"])
                 show_solution_checkbox = gr.Checkbox(label=LANG["show_solution_comparison"], value=False)
                 info_display = gr.Markdown(LANG["select_product_prompt"])
             with gr.Column(scale=3):
                 plotly_chart_output = gr.Plot(label=LANG["averaged_spider_diagram"])
 
-    with gr.Tab(LANG["tab_overview"]):
+    with gr.Tab(LANG["tab_overview"]) as overview_tab:
         refresh_btn_overview = gr.Button(LANG["refresh_overview_data"])
         overview_plot_outputs = []
-        figs_init = generate_overview_plots(initial_data, LANG)
+        # Only empty plot slots are created at startup; the figures are built when the tab is first opened.
+        # All OVERVIEW_SLOTS slots always exist, so every refresh returns the same number of outputs.
+        overview_keys_state = gr.State([])
+        scored_products = [product_name for product_name in product_list
+                           if _product_view(initial_data, product_name).get('avg_scores')][:OVERVIEW_SLOTS]
         with gr.Row():
             for col_idx in range(4):
                 with gr.Column():
                     for row_idx in range(2):
                         idx = row_idx + col_idx * 2
-                        if idx < len(figs_init):
-                            name, fig = figs_init[idx]
-                            p = gr.Plot(label=f"{name} {LANG['overview_label']}", value=fig)
-                            overview_plot_outputs.append(p)
+                        if idx < len(scored_products):
+                            p = gr.Plot(label=f"{scored_products[idx]} {LANG['overview_label']}")
+                        else:
+                            p = gr.Plot(visible=False)
+                        overview_plot_outputs.append(p)
 
     with gr.Tab(LANG["tab_compare_products"]):
         gr.Markdown("## " + LANG["compare_two_products_label"])
         with gr.Row():
             with gr.Column(scale=1):
-                product1_dropdown = gr.Dropdown(choices=sorted(list(initial_data.keys())), label=LANG["select_product1"])
-                product2_dropdown = gr.Dropdown(choices=sorted(list(initial_data.keys())), label=LANG["select_product2"])
+                product1_dropdown = gr.Dropdown(choices=product_list, label=LANG["select_product1"])
+                product2_dropdown = gr.Dropdown(choices=product_list, label=LANG["select_product2"])
                 show_solution_compare_checkbox = gr.Checkbox(label=LANG["show_solution_comparison"], value=False)
                 show_user_average_compare_checkbox = gr.Checkbox(label=LANG["show_user_averages"], value=True)
                 compare_info_display = gr.Markdown(LANG["select_two_products_prompt"])
@@ -284,24 +671,23 @@ with gr.Blocks(title=LANG["dashboard_title"], css=".gr-row {flex-wrap: nowrap;}
                                                       value=create_comparison_spider_diagram_plotly(None, None, False, True, initial_data, LANG))
 
     # Events
-    product_dropdown.change(update_visualization, [product_dropdown, show_solution_checkbox, all_processed_data, current_lang_state], [plotly_chart_output, info_display])
-    show_solution_checkbox.change(update_visualization, [product_dropdown, show_solution_checkbox, all_processed_data, current_lang_state], [plotly_chart_output, info_display])
-
-    product1_dropdown.change(update_comparison_visualization,
-                             [product1_dropdown, product2_dropdown, show_solution_compare_checkbox, show_user_average_compare_checkbox, all_processed_data, current_lang_state],
-                             [compare_plotly_chart_output, compare_info_display])
-    product2_dropdown.change(update_comparison_visualization,
-                             [product1_dropdown, product2_dropdown, show_solution_compare_checkbox, show_user_average_compare_checkbox, all_processed_data, current_lang_state],
-                             [compare_plotly_chart_output, compare_info_display])
-    show_solution_compare_checkbox.change(update_comparison_visualization,
-                                          [product1_dropdown, product2_dropdown, show_solution_compare_checkbox, show_user_average_compare_checkbox, all_processed_data, current_lang_state],
-                                          [compare_plotly_chart_output, compare_info_display])
-    show_user_average_compare_checkbox.change(update_comparison_visualization,
-                                              [product1_dropdown, product2_dropdown, show_solution_compare_checkbox, show_user_average_compare_checkbox, all_processed_data, current_lang_state],
-                                              [compare_plotly_chart_output, compare_info_display])
-
-    refresh_btn_global.click(refresh_data, [current_lang_state], [all_processed_data, product_dropdown, *overview_plot_outputs, compare_plotly_chart_output, product1_dropdown, product2_dropdown])
-    refresh_btn_overview.click(lambda lang: [fig for _, fig in generate_overview_plots(load_and_process_data(), lang)], [current_lang_state], overview_plot_outputs)
+    # One listener per tab; trigger_mode="always_last" drops intermediate events while a rebuild is
+    # running, so rapid toggles produce one figure for the final state instead of one per click.
+    gr.on(triggers=[product_dropdown.change, show_solution_checkbox.change],
+          fn=update_visualization,
+          inputs=[product_dropdown, show_solution_checkbox, all_processed_data, current_lang_state],
+          outputs=[plotly_chart_output, info_display],
+          trigger_mode="always_last")
+
+    gr.on(triggers=[product1_dropdown.change, product2_dropdown.change, show_solution_compare_checkbox.change, show_user_average_compare_checkbox.change],
+          fn=update_comparison_visualization,
+          inputs=[product1_dropdown, product2_dropdown, show_solution_compare_checkbox, show_user_average_compare_checkbox, all_processed_data, current_lang_state],
+          outputs=[compare_plotly_chart_output, compare_info_display],
+          trigger_mode="always_last")
+
+    refresh_btn_global.click(refresh_data, [current_lang_state, overview_keys_state], [all_processed_data, product_dropdown, *overview_plot_outputs, compare_plotly_chart_output, product1_dropdown, product2_dropdown, overview_keys_state])
+    refresh_btn_overview.click(refresh_overview, [all_processed_data, current_lang_state, overview_keys_state], [*overview_plot_outputs, overview_keys_state])
+    overview_tab.select(refresh_overview, [all_processed_data, current_lang_state, overview_keys_state], [*overview_plot_outputs, overview_keys_state])
 
     # Language buttons
     dashboard_components_to_update = [
@@ -1,11 +1,18 @@
+import functools
+import io
 import json
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+import numpy as np
+from matplotlib.figure import Figure as MplFigure
 import plotly.graph_objects as go
 import plotly.io as pio
+from ux4ai_common import (REPORT_WORKERS, SCORE_LABELS, SPIDER_LAYOUT_TEMPLATE, json_loads, load_lang_file,
+                          load_lecturer_solutions, scale_bounds, start_image_export, stop_image_export, write_file_atomic)
 
 # Ensure Kaleido is available for image export
 # CHANGED: Updated to use plotly.io.defaults to address DeprecationWarning
@@ -13,230 +20,294 @@ pio.defaults.default_format = "png"
 pio.defaults.default_width = 700
 pio.defaults.default_height = 400
 
-# --- Language setup ---
-LANG_DIR = "./lang"
-DEFAULT_LANG = "en" # Default language for reports
-
-def load_lang_file(lang_code):
-    file_path = os.path.join(LANG_DIR, f"{lang_code}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Language file not found for '{lang_code}'. Falling back to default.")
-        if lang_code == DEFAULT_LANG:
-            raise FileNotFoundError(f"Default language file '{DEFAULT_LANG}.json' also not found.")
-        return load_lang_file(DEFAULT_LANG)
-    except json.JSONDecodeError:
-        print(f"Error decoding JSON for '{lang_code}', falling back to default.")
-        if lang_code == DEFAULT_LANG:
-            raise json.JSONDecodeError(f"Default language file '{DEFAULT_LANG}.json' is malformed.", doc="", pos=0)
-        return load_lang_file(DEFAULT_LANG)
-
 # --- Directories ---
 DATA_DIR = "./data"
-SOLUTION_DIR = "./solutions"
 SUMMARY_REPORTS_DIR = "./summary_reports" # New directory for summary reports
 
 # Ensure summary reports directory exists
 os.makedirs(SUMMARY_REPORTS_DIR, exist_ok=True)
 
-# --- Helper to load solution data ---
-def load_solution_data(product_name):
-    safe_filename = product_name.lower().replace(" ", "_").replace("/", "_") + ".json"
-    solution_path = os.path.join(SOLUTION_DIR, safe_filename)
-    if os.path.exists(solution_path):
-        try:
-            with open(solution_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading solution file {solution_path}: {e}")
-    return None
+# --- Helpers to load one student submission as an aggregation record ---
+# Very large submissions are streamed with ijson (when installed), keeping only the top-level
+# fields the summary aggregates; regular-sized files are parsed whole, which is faster.
+try:
+    import ijson
+    STUDENT_DATA_ERRORS = (json.JSONDecodeError, IOError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    STUDENT_DATA_ERRORS = (json.JSONDecodeError, IOError)
+
+STREAM_MIN_SIZE = 1024 * 1024
+STUDENT_FIELDS = frozenset(("product_name", "scores", "ai_role", "risk_of_adversarial_attacks", "continuous_learning_feedback_loops"))
+
+# Record layout: (score row, AI role, risk level, risk description, analytics level, CL aspects, analytics explanation)
+def student_record_from_dict(student_data):
+    product_name = student_data.get("product_name")
+    if not product_name:
+        return None
+    scores = student_data.get("scores")
+    risk_info = student_data.get("risk_of_adversarial_attacks")
+    cl_info = student_data.get("continuous_learning_feedback_loops")
+    return product_name, (
+        [scores.get(key, 0.0) for key in SCORE_LABELS] if scores else None,
+        student_data.get("ai_role"),
+        risk_info.get("level", 0.0) if risk_info else None,
+        risk_info.get("description") if risk_info else None,
+        cl_info.get("analytics_type_level", 0.0) if cl_info else None,
+        cl_info.get("aspects") if cl_info else None,
+        cl_info.get("analytics_explanation") if cl_info else None
+    )
+
+# With msgspec installed, submissions are decoded straight into typed structs holding only the
+# aggregated fields, so the record is read off attributes instead of nested dict lookups.
+try:
+    import msgspec
+
+    class StudentRisk(msgspec.Struct):
+        level: float | None = 0.0
+        description: str | None = None
+
+    class StudentLearning(msgspec.Struct):
+        analytics_type_level: float | None = 0.0
+        aspects: str | None = None
+        analytics_explanation: str | None = None
+
+    class StudentSubmission(msgspec.Struct):
+        product_name: str | None = None
+        scores: dict[str, float] | None = None
+        ai_role: str | None = None
+        risk_of_adversarial_attacks: StudentRisk | None = None
+        continuous_learning_feedback_loops: StudentLearning | None = None
+
+    student_decoder = msgspec.json.Decoder(StudentSubmission)
+    STUDENT_DATA_ERRORS += (msgspec.DecodeError,)
+
+    def decode_student_record(buf):
+        submission = student_decoder.decode(buf)
+        if not submission.product_name:
+            return None
+        scores = submission.scores
+        risk_info = submission.risk_of_adversarial_attacks
+        cl_info = submission.continuous_learning_feedback_loops
+        return submission.product_name, (
+            [scores.get(key, 0.0) for key in SCORE_LABELS] if scores else None,
+            submission.ai_role,
+            risk_info.level if risk_info else None,
+            risk_info.description if risk_info else None,
+            cl_info.analytics_type_level if cl_info else None,
+            cl_info.aspects if cl_info else None,
+            cl_info.analytics_explanation if cl_info else None
+        )
+except ImportError:
+    def decode_student_record(buf):
+        return student_record_from_dict(json_loads(buf))
+
+# Builds only the top-level STUDENT_FIELDS values from the event stream: other subtrees are skipped
+# without materializing them, and reading stops as soon as every wanted field has been seen
+def stream_student_fields(f):
+    fields = {}
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is None:
+            if prefix == '' and event == 'map_key' and value in STUDENT_FIELDS:
+                key, builder = value, ijson.ObjectBuilder()
+            continue
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            fields[key] = builder.value
+            builder = None
+            if len(fields) == len(STUDENT_FIELDS):
+                break
+    return fields
+
+# Returns (product_name, record), or None for submissions without a product
+def load_student_record(file_path):
+    with open(file_path, "rb") as f:
+        if ijson is not None and os.fstat(f.fileno()).st_size > STREAM_MIN_SIZE:
+            return student_record_from_dict(stream_student_fields(f))
+        return decode_student_record(f.read())
 
 # --- Function to create spider diagram for summary report ---
+
+# Axis labels only depend on the language strings, so they are split once per language
+@functools.lru_cache(maxsize=None)
+def spider_theta_closed(label_texts):
+    theta = [text.split('(')[0].strip() for text in label_texts]
+    return theta + [theta[0]] # Close the loop
+
 def create_summary_spider_diagram(avg_student_scores, lecturer_scores, lang_dict, product_name):
-    labels = ['conversational', 'specialization', 'autonomy', 'accessibility', 'explainability']
-    theta = [lang_dict[label + "_label"].split('(')[0].strip() for label in labels]
-    theta_closed = theta + [theta[0]] # Close the loop
+    labels = SCORE_LABELS
+    theta_closed = spider_theta_closed(tuple(lang_dict[label + "_label"] for label in labels))
 
-    fig = go.Figure()
+    traces = []
 
     # Average Student scores trace
     if avg_student_scores:
         student_values = [avg_student_scores.get(label.lower(), 0) for label in labels]
         student_values.append(student_values[0]) # Close the shape
-        fig.add_trace(go.Scatterpolar(
-            r=student_values,
-            theta=theta_closed,
-            fill='toself',
-            name=lang_dict["student_avg_label_plot"],
-            line=dict(color='blue', width=3)
-        ))
+        traces.append({'type': 'scatterpolar', 'r': student_values, 'theta': theta_closed, 'fill': 'toself',
+                       'name': lang_dict["student_avg_label_plot"], 'line': {'color': 'blue', 'width': 3}})
 
     # Lecturer scores trace
     if lecturer_scores:
         lecturer_values = [lecturer_scores.get(label.lower(), 0) for label in labels]
         lecturer_values.append(lecturer_values[0]) # Close the shape
-        fig.add_trace(go.Scatterpolar(
-            r=lecturer_values,
-            theta=theta_closed,
-            fill='toself',
-            name=lang_dict["lecturer_ans_label_plot"],
-            line=dict(color='green', width=2)
-        ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 5])
-        ),
-        showlegend=True,
-        title=f"{lang_dict['spider_diagram_label']} - {product_name}",
-        height=400,
-        margin=dict(l=50, r=50, t=70, b=50)
-    )
-    return fig
+        traces.append({'type': 'scatterpolar', 'r': lecturer_values, 'theta': theta_closed, 'fill': 'toself',
+                       'name': lang_dict["lecturer_ans_label_plot"], 'line': {'color': 'green', 'width': 2}})
 
-# --- Function to create a plot for a single 0-5 value comparison (reused from individual report) ---
-def create_single_value_comparison_plot(user_value, lecturer_value, title, min_label, max_label, lang_dict):
-    fig = go.Figure()
+    return go.Figure({
+        'data': traces,
+        'layout': {**SPIDER_LAYOUT_TEMPLATE, 'title': {'text': f"{lang_dict['spider_diagram_label']} - {product_name}"}}
+    }, _validate=False)
 
+# --- Function to render a single 0-5 value comparison as PNG bytes (reused from individual report) ---
+def create_single_value_comparison_plot(user_value, lecturer_value, title, min_label, max_label, lang_dict):
     y_labels = [lang_dict["student_avg_label_plot"], lang_dict["lecturer_ans_label_plot"]]
     x_values = [user_value if user_value is not None else 0, lecturer_value if lecturer_value is not None else 0]
     colors = ['blue', 'green']
     text_values = [f"{v:.1f}" if v is not None else "N/A" for v in [user_value, lecturer_value]]
 
-    fig.add_trace(go.Bar(
-        y=y_labels,
-        x=x_values,
-        orientation='h',
-        marker_color=colors,
-        text=text_values,
-        textposition='outside',
-        name='',
-        width=0.8
-    ))
-
-    fig.update_layout(
-        title=title,
-        xaxis=dict(
-            range=[0, 5],
-            tickvals=[0, 1, 2, 3, 4, 5],
-            title_text=f"{min_label.split(':')[0].strip()} - {max_label.split(':')[0].strip()}",
-            showgrid=True
-        ),
-        yaxis=dict(
-            showgrid=False,
-            categoryorder='array',
-            categoryarray=y_labels
-        ),
-        height=200,
-        width=pio.defaults.default_width, # CHANGED: Use pio.defaults.default_width
-        bargap=0.0,
-        margin=dict(l=150, r=50, t=50, b=50),
-        showlegend=False
+    # A two-bar chart does not need a headless browser: matplotlib's Agg renderer draws it directly.
+    # The figure is created without pyplot, so no global figure state is kept between calls.
+    fig = MplFigure(figsize=(7, 2), dpi=100)
+    ax = fig.add_subplot()
+    bars = ax.barh(y_labels, x_values, color=colors, height=0.8)
+    ax.bar_label(bars, labels=text_values, padding=3)
+    ax.set_xlim(0, 5)
+    ax.set_xticks([0, 1, 2, 3, 4, 5])
+    ax.set_xlabel(f"{min_label.split(':')[0].strip()} - {max_label.split(':')[0].strip()}")
+    ax.grid(axis='x')
+    ax.set_axisbelow(True)
+    ax.set_title(title)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    return buf.getvalue()
+
+
+# All report images are placed at the same width; python-docx derives the height from the PNG header
+REPORT_IMAGE_WIDTH = Inches(6.5)
+
+# --- Render the three report images of a product as PNG bytes ---
+def render_product_images(product_name, student_agg_data, lecturer_data, lang_dict, risk_bounds, analytics_bounds):
+    fig_spider = create_summary_spider_diagram(
+        student_agg_data['avg_scores'],
+        lecturer_data.get('scores') or {},
+        lang_dict,
+        product_name
     )
-    return fig
-
+    risk_png = create_single_value_comparison_plot(
+        student_agg_data['avg_risk_level'],
+        (lecturer_data.get('risk_of_adversarial_attacks') or {}).get('level'),
+        lang_dict['avg_risk_level_label_short'],
+        *risk_bounds,
+        lang_dict
+    )
+    analytics_png = create_single_value_comparison_plot(
+        student_agg_data['avg_analytics_level'],
+        (lecturer_data.get('continuous_learning_feedback_loops') or {}).get('analytics_type_level'),
+        lang_dict['avg_analytics_level_label_short'],
+        *analytics_bounds,
+        lang_dict
+    )
+    return fig_spider.to_image(), risk_png, analytics_png
+
+# Each worker process renders its share of the products with its own Kaleido browser and returns
+# plain bytes; the document itself is assembled in the main process.
+def render_product_batch(jobs, lang_dict):
+    risk_bounds = scale_bounds(lang_dict['risk_level_label'])
+    analytics_bounds = scale_bounds(lang_dict['analytics_type_label'])
+    server_started = start_image_export()
+    try:
+        return [(product_name, render_product_images(product_name, student_agg_data, lecturer_data, lang_dict, risk_bounds, analytics_bounds))
+                for product_name, student_agg_data, lecturer_data in jobs]
+    finally:
+        if server_started:
+            stop_image_export()
 
 # --- Main aggregation and report generation logic ---
 if __name__ == "__main__":
     report_language = "de" # Set desired language for the summary report
     current_lang_dict = load_lang_file(report_language)
 
-    # --- 1. Load All Lecturer Solutions ---
-    lecturer_solutions_by_product = {}
-    for filename in os.listdir(SOLUTION_DIR):
-        if filename.endswith(".json"):
-            temp_product_name = filename.replace(".json", "").replace("_", " ").title()
-            solution_data = load_solution_data(temp_product_name)
-            if solution_data and solution_data.get("product_name"):
-                 lecturer_solutions_by_product[solution_data["product_name"]] = solution_data
-            elif solution_data:
-                lecturer_solutions_by_product[temp_product_name] = solution_data
-
-    # --- 2. Aggregate All Student Data ---
-    aggregated_student_data = defaultdict(lambda: {
-        "count": 0,
-        "scores_sum": defaultdict(float),
-        "ai_role_counts": defaultdict(int),
-        "risk_level_sum": 0.0,
-        "analytics_level_sum": 0.0,
-        # For qualitative fields, we'll just note they are aggregated
-        "risk_description_agg": [],
-        "continuous_learning_aspects_agg": [],
-        "analytics_explanation_agg": []
-    })
+    # --- 1. Aggregate All Student Data ---
+    # Each submission is appended as one flat record per product; all reductions happen once after the walk
+    student_records_by_product = defaultdict(list)
 
     if os.path.exists(DATA_DIR):
-        for user_dir in os.listdir(DATA_DIR):
-            user_path = os.path.join(DATA_DIR, user_dir)
-            if os.path.isdir(user_path):
-                for filename in os.listdir(user_path):
-                    if filename.endswith(".json"):
-                        file_path = os.path.join(user_path, filename)
-                        try:
-                            # CHANGED: Corrected json.load() to open the file first
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                student_data = json.load(f)
-                            product_name = student_data.get("product_name")
-                            if not product_name:
-                                continue
-
-                            agg = aggregated_student_data[product_name]
-                            agg["count"] += 1
-
-                            # Scores
-                            if student_data.get("scores"):
-                                for key, value in student_data["scores"].items():
-                                    agg["scores_sum"][key] += value
-
-                            # AI Role
-                            if student_data.get("ai_role"):
-                                agg["ai_role_counts"][student_data["ai_role"]] += 1
-
-                            # Risk
-                            if student_data.get("risk_of_adversarial_attacks"):
-                                risk_info = student_data["risk_of_adversarial_attacks"]
-                                agg["risk_level_sum"] += risk_info.get("level", 0.0)
-                                if risk_info.get("description"):
-                                    agg["risk_description_agg"].append(risk_info["description"])
-
-                            # Continuous Learning
-                            if student_data.get("continuous_learning_feedback_loops"):
-                                cl_info = student_data["continuous_learning_feedback_loops"]
-                                agg["analytics_level_sum"] += cl_info.get("analytics_type_level", 0.0)
-                                if cl_info.get("aspects"):
-                                    agg["continuous_learning_aspects_agg"].append(cl_info["aspects"])
-                                if cl_info.get("analytics_explanation"):
-                                    agg["analytics_explanation_agg"].append(cl_info["analytics_explanation"])
-
-                        except (json.JSONDecodeError, IOError) as e:
-                            print(f"Error reading student data file {file_path}: {e}")
-
-    # Calculate averages from sums
+        # DirEntry.is_dir reuses the file type from the directory listing instead of a stat per entry;
+        # each listing is closed before its files are read
+        with os.scandir(DATA_DIR) as it:
+            user_paths = [user_entry.path for user_entry in it if user_entry.is_dir(follow_symlinks=False)]
+        for user_path in user_paths:
+            with os.scandir(user_path) as it:
+                file_paths = [file_entry.path for file_entry in it if file_entry.name.endswith(".json")]
+            for file_path in file_paths:
+                try:
+                    student_record = load_student_record(file_path)
+                    if student_record is None:
+                        continue
+                    product_name, record = student_record
+                    student_records_by_product[product_name].append(record)
+                except STUDENT_DATA_ERRORS as e:
+                    print(f"Error reading student data file {file_path}: {e}")
+
+    # Reduce the records of each product to counts and averages
     processed_student_data = {}
-    for product, data in aggregated_student_data.items():
-        count = data["count"]
-        if count > 0:
-            avg_scores = {k: v / count for k, v in data["scores_sum"].items()}
-            processed_student_data[product] = {
-                "count": count,
-                "avg_scores": avg_scores,
-                "ai_role_counts": data["ai_role_counts"],
-                "avg_risk_level": data["risk_level_sum"] / count,
-                "avg_analytics_level": data["analytics_level_sum"] / count,
-                "risk_description_agg": data["risk_description_agg"],
-                "continuous_learning_aspects_agg": data["continuous_learning_aspects_agg"],
-                "analytics_explanation_agg": data["analytics_explanation_agg"]
-            }
-
-    # --- 3. Generate Summary DocX Report ---
+    for product, records in student_records_by_product.items():
+        count = len(records)
+        score_rows, ai_roles, risk_levels, risk_descriptions, analytics_levels, cl_aspects, analytics_explanations = zip(*records)
+        # Submissions without a value contribute 0, so sums are divided by the full count.
+        # A product without any scored submission gets no average scores, and so no student trace.
+        scored_rows = [row for row in score_rows if row is not None]
+        if scored_rows:
+            score_sums = np.asarray(scored_rows, dtype=np.float64).sum(axis=0)
+            avg_scores = dict(zip(SCORE_LABELS, (score_sums / count).tolist()))
+        else:
+            avg_scores = {}
+        processed_student_data[product] = {
+            "count": count,
+            "avg_scores": avg_scores,
+            "ai_role_counts": Counter(role for role in ai_roles if role),
+            "avg_risk_level": float(np.sum([level for level in risk_levels if level is not None], dtype=np.float64)) / count,
+            "avg_analytics_level": float(np.sum([level for level in analytics_levels if level is not None], dtype=np.float64)) / count,
+            # For qualitative fields, we'll just note they are aggregated
+            "risk_description_agg": [text for text in risk_descriptions if text],
+            "continuous_learning_aspects_agg": [text for text in cl_aspects if text],
+            "analytics_explanation_agg": [text for text in analytics_explanations if text]
+        }
+
+    # --- 2. Look up the lecturer solutions of the products that have student data ---
+    # Solutions are only loaded once there is something to report on; products nobody submitted are never rendered
+    product_names = sorted(processed_student_data.keys())
+    lecturer_solutions_by_product = load_lecturer_solutions() if product_names else {}
+    lecturer_data_by_product = {name: lecturer_solutions_by_product.get(name, {}) for name in product_names}
+
+    # --- 3. Render all product images in parallel ---
+    render_jobs = [(name, processed_student_data[name], lecturer_data_by_product[name]) for name in product_names]
+    product_images = {}
+    if render_jobs:
+        n_workers = min(REPORT_WORKERS, len(render_jobs))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            batches = [render_jobs[i::n_workers] for i in range(n_workers)]
+            for batch_result in executor.map(render_product_batch, batches, [current_lang_dict] * n_workers):
+                product_images.update(batch_result)
+
+    # --- 4. Generate Summary DocX Report ---
     summary_document = Document()
+    # Looked up once; assigning a style by name searches the document's styles part for every table
+    table_grid_style = summary_document.styles['Table Grid']
     summary_document.add_heading(current_lang_dict['summary_report_title'], level=1)
+    ai_role_header = current_lang_dict['ai_role_label'].split('(')[0].strip()
 
-    for product_name in sorted(processed_student_data.keys()):
+    for product_name in product_names:
         student_agg_data = processed_student_data.get(product_name)
-        lecturer_data = lecturer_solutions_by_product.get(product_name, {})
+        lecturer_data = lecturer_data_by_product[product_name]
 
         summary_document.add_heading(f"{current_lang_dict['product_label']}: {product_name}", level=2)
 
@@ -254,30 +325,23 @@ if __name__ == "__main__":
             summary_document.add_paragraph(f"- {role}: {count}")
         summary_document.add_paragraph() # Spacer
 
+        spider_png, risk_png, analytics_png = product_images[product_name]
+
         # --- UX4AI Spider Diagram ---
         summary_document.add_heading(current_lang_dict['spider_diagram_label'], level=3)
-        fig_spider = create_summary_spider_diagram(
-            student_agg_data['avg_scores'],
-            lecturer_data.get('scores', {}),
-            current_lang_dict,
-            product_name
-        )
-        temp_spider_image_path = f"temp_summary_spider_{product_name.replace(' ', '_')}.png"
-        fig_spider.write_image(temp_spider_image_path)
-        summary_document.add_picture(temp_spider_image_path, width=Inches(6.5))
-        os.remove(temp_spider_image_path)
+        summary_document.add_picture(io.BytesIO(spider_png), width=REPORT_IMAGE_WIDTH)
         summary_document.add_paragraph() # Spacer
 
         # --- AI Role Comparison Table ---
         summary_document.add_heading(current_lang_dict['ai_role_comparison_label'], level=3)
-        table_ai_role = summary_document.add_table(rows=1, cols=3)
-        table_ai_role.style = 'Table Grid'
+        table_ai_role = summary_document.add_table(rows=2, cols=3) # Header + answer row, preallocated
+        table_ai_role.style = table_grid_style
         hdr_cells_ai_role = table_ai_role.rows[0].cells
-        hdr_cells_ai_role[0].text = current_lang_dict['ai_role_label'].split('(')[0].strip()
+        hdr_cells_ai_role[0].text = ai_role_header
         hdr_cells_ai_role[1].text = current_lang_dict['student_avg_label_plot']
         hdr_cells_ai_role[2].text = current_lang_dict['lecturer_ans_label_plot']
 
-        row_cells = table_ai_role.add_row().cells
+        row_cells = table_ai_role.rows[1].cells
         # Determine most frequent student AI role
         most_frequent_student_role = "N/A"
         if student_agg_data['ai_role_counts']:
@@ -292,18 +356,7 @@ if __name__ == "__main__":
 
         # --- Risk Level Comparison Plot ---
         summary_document.add_heading(current_lang_dict['risk_section_title_from_user'], level=3)
-        fig_risk = create_single_value_comparison_plot(
-            student_agg_data['avg_risk_level'],
-            lecturer_data.get('risk_of_adversarial_attacks', {}).get('level'),
-            current_lang_dict['avg_risk_level_label_short'],
-            current_lang_dict['risk_level_label'].split('(')[1].split(',')[0].strip().replace(')', ''),
-            current_lang_dict['risk_level_label'].split('(')[1].split(',')[1].strip().replace(')', ''),
-            current_lang_dict
-        )
-        temp_risk_image_path = f"temp_summary_risk_plot_{product_name.replace(' ', '_')}.png"
-        fig_risk.write_image(temp_risk_image_path)
-        summary_document.add_picture(temp_risk_image_path, width=Inches(6.5))
-        os.remove(temp_risk_image_path)
+        summary_document.add_picture(io.BytesIO(risk_png), width=REPORT_IMAGE_WIDTH)
         summary_document.add_paragraph() # Spacer
 
 
@@ -311,18 +364,7 @@ if __name__ == "__main__":
         summary_document.add_heading(current_lang_dict['continuous_learning_section_title_from_user'], level=3)
 
         # --- Analytics Type Level Plot ---
-        fig_analytics = create_single_value_comparison_plot(
-            student_agg_data['avg_analytics_level'],
-            lecturer_data.get('continuous_learning_feedback_loops', {}).get('analytics_type_level'),
-            current_lang_dict['avg_analytics_level_label_short'],
-            current_lang_dict['analytics_type_label'].split('(')[1].split(',')[0].strip().replace(')', ''),
-            current_lang_dict['analytics_type_label'].split('(')[1].split(',')[1].strip().replace(')', ''),
-            current_lang_dict
-        )
-        temp_analytics_image_path = f"temp_summary_analytics_plot_{product_name.replace(' ', '_')}.png"
-        fig_analytics.write_image(temp_analytics_image_path)
-        summary_document.add_picture(temp_analytics_image_path, width=Inches(6.5))
-        os.remove(temp_analytics_image_path)
+        summary_document.add_picture(io.BytesIO(analytics_png), width=REPORT_IMAGE_WIDTH)
         summary_document.add_paragraph() # Spacer
 
 
@@ -330,5 +372,7 @@ if __name__ == "__main__":
 
     # Save the summary document
     summary_report_filename = os.path.join(SUMMARY_REPORTS_DIR, f"UX4AI_Overall_Summary_Report_{report_language.upper()}.docx")
-    summary_document.save(summary_report_filename)
+    buf = io.BytesIO()
+    summary_document.save(buf)
+    write_file_atomic(summary_report_filename, buf.getbuffer())
     print(f"Overall summary report generated: {summary_report_filename}")
\ No newline at end of file
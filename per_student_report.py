@@ -1,161 +1,169 @@
+import copy
+import functools
+import io
 import json
 import os
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from matplotlib.figure import Figure as MplFigure
 import plotly.graph_objects as go
 import plotly.io as pio
+from ux4ai_common import (REPORT_WORKERS, SCORE_LABELS, SPIDER_LAYOUT_TEMPLATE, json_loads, load_lang_file,
+                          load_lecturer_solutions, scale_bounds, start_image_export, stop_image_export, write_file_atomic)
 
 # Ensure Kaleido is available for image export
-pio.kaleido.scope.default_format = "png"
-pio.kaleido.scope.default_width = 700
-pio.kaleido.scope.default_height = 400
-
-# --- Language setup ---
-LANG_DIR = "./lang"
-DEFAULT_LANG = "en" # Default language for reports
-
-def load_lang_file(lang_code):
-    file_path = os.path.join(LANG_DIR, f"{lang_code}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Language file not found for '{lang_code}'. Falling back to default.")
-        if lang_code == DEFAULT_LANG:
-            raise FileNotFoundError(f"Default language file '{DEFAULT_LANG}.json' also not found.")
-        return load_lang_file(DEFAULT_LANG)
-    except json.JSONDecodeError:
-        print(f"Error decoding JSON for '{lang_code}', falling back to default.")
-        if lang_code == DEFAULT_LANG:
-            raise json.JSONDecodeError(f"Default language file '{DEFAULT_LANG}.json' is malformed.", doc="", pos=0)
-        return load_lang_file(DEFAULT_LANG)
+# CHANGED: Use plotly.io.defaults as in the summary report; pio.kaleido.scope is gone in the plotly
+# releases that ship the persistent Kaleido server used below
+pio.defaults.default_format = "png"
+pio.defaults.default_width = 700
+pio.defaults.default_height = 400
 
 # --- Directories ---
 DATA_DIR = "./data"
-SOLUTION_DIR = "./solutions"
 REPORTS_DIR = "./reports" # New directory for generated reports
 
 # Ensure reports directory exists
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
-# --- Helper to load solution data ---
-def load_solution_data(product_name):
-    safe_filename = product_name.lower().replace(" ", "_").replace("/", "_") + ".json"
-    solution_path = os.path.join(SOLUTION_DIR, safe_filename)
-    if os.path.exists(solution_path):
-        try:
-            with open(solution_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading solution file {solution_path}: {e}")
-    return None
-
-# --- Function to create spider diagram for the report ---
-def create_report_spider_diagram(user_scores, solution_scores, lang_dict, product_name):
-    labels = ['conversational', 'specialization', 'autonomy', 'accessibility', 'explainability']
-    # Extract just the main label part, removing descriptions in parentheses
-    theta = [lang_dict[label + "_label"].split('(')[0].strip() for label in labels]
-    theta_closed = theta + [theta[0]] # Close the loop
+# --- Functions to render the report charts as PNG bytes ---
+# Renders are memoized on the plotted values and label texts: the lecturer side repeats for every
+# student of a product and the 0-5 levels take few distinct values, so identical charts across
+# students are rendered once per run.
+def _render_memoized(render, *args):
+    # Malformed submissions can carry lists or dicts where numbers belong; those charts are rendered uncached
+    try:
+        hash(args)
+    except TypeError:
+        return render.__wrapped__(*args)
+    return render(*args)
 
-    fig = go.Figure()
+@functools.lru_cache(maxsize=512)
+def render_spider_diagram_png(user_values, solution_values, theta_closed, user_label, lecturer_label, title):
+    traces = []
 
     # User scores trace
+    if user_values:
+        traces.append({'type': 'scatterpolar', 'r': user_values, 'theta': theta_closed, 'fill': 'toself',
+                       'name': user_label, 'line': {'color': 'blue', 'width': 3}})
+
+    # Solution scores trace
+    if solution_values:
+        traces.append({'type': 'scatterpolar', 'r': solution_values, 'theta': theta_closed, 'fill': 'toself',
+                       'name': lecturer_label, 'line': {'color': 'green', 'width': 2}})
+
+    fig = go.Figure({
+        'data': traces,
+        'layout': {**SPIDER_LAYOUT_TEMPLATE, 'title': {'text': title}}
+    }, _validate=False)
+    return fig.to_image(format="png")
+
+# Axis labels only depend on the language strings, so they are split once per language
+@functools.lru_cache(maxsize=None)
+def spider_theta_closed(label_texts):
+    # Extract just the main label part, removing descriptions in parentheses
+    theta = [text.split('(')[0].strip() for text in label_texts]
+    return tuple(theta + [theta[0]]) # Close the loop
+
+def create_report_spider_diagram(user_scores, solution_scores, lang_dict, product_name):
+    labels = SCORE_LABELS
+    theta_closed = spider_theta_closed(tuple(lang_dict[label + "_label"] for label in labels))
+
+    user_values = None
     if user_scores:
         user_values = [user_scores.get(label.lower(), 0) for label in labels]
-        user_values.append(user_values[0]) # Close the shape
-        fig.add_trace(go.Scatterpolar(
-            r=user_values,
-            theta=theta_closed,
-            fill='toself',
-            name=lang_dict["user_answer_column_header"],
-            line=dict(color='blue', width=3)
-        ))
+        user_values = tuple(user_values + [user_values[0]]) # Close the shape
 
-    # Solution scores trace
+    solution_values = None
     if solution_scores:
         solution_values = [solution_scores.get(label.lower(), 0) for label in labels]
-        solution_values.append(solution_values[0]) # Close the shape
-        fig.add_trace(go.Scatterpolar(
-            r=solution_values,
-            theta=theta_closed,
-            fill='toself',
-            name=lang_dict["lecturer_answer_column_header"],
-            line=dict(color='green', width=2)
-        ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 5])
-        ),
-        showlegend=True,
-        title=f"{lang_dict['spider_diagram_label']} - {product_name}",
-        height=400,
-        margin=dict(l=50, r=50, t=70, b=50) # Adjust margins for better fit
-    )
-    return fig
+        solution_values = tuple(solution_values + [solution_values[0]]) # Close the shape
 
-# --- NEW: Function to create a plot for a single 0-5 value comparison ---
-def create_single_value_comparison_plot(user_value, lecturer_value, title, min_label, max_label, lang_dict):
-    fig = go.Figure()
+    return _render_memoized(
+        render_spider_diagram_png,
+        user_values, solution_values, theta_closed,
+        lang_dict["user_answer_column_header"], lang_dict["lecturer_answer_column_header"],
+        f"{lang_dict['spider_diagram_label']} - {product_name}"
+    )
 
+@functools.lru_cache(maxsize=512)
+def render_comparison_plot_png(user_value, lecturer_value, title, min_label, max_label, user_label, lecturer_label):
     # Data for plotting
-    y_labels = [lang_dict["user_answer_column_header"], lang_dict["lecturer_answer_column_header"]]
+    y_labels = [user_label, lecturer_label]
     x_values = [user_value if user_value is not None else 0, lecturer_value if lecturer_value is not None else 0]
     colors = ['blue', 'green']
     text_values = [f"{v:.1f}" if v is not None else "N/A" for v in [user_value, lecturer_value]]
 
-    fig.add_trace(go.Bar(
-        y=y_labels,
-        x=x_values,
-        orientation='h',
-        marker_color=colors,
-        text=text_values,
-        textposition='outside',
-        name='', # No legend needed for individual bars in this context
-        width=0.8 # CHANGED: Make bars thinner
-    ))
-
-    fig.update_layout(
-        title=title,
-        xaxis=dict(
-            range=[0, 5],
-            tickvals=[0, 1, 2, 3, 4, 5],
-            title_text=f"{min_label.split(':')[0].strip()} - {max_label.split(':')[0].strip()}",
-            showgrid=True
-        ),
-        yaxis=dict(
-            showgrid=False,
-            categoryorder='array',
-            categoryarray=y_labels # Ensure order is preserved
-        ),
-        height=100, # Compact height
-        width=pio.kaleido.scope.default_width, # Ensure width is consistent with image export
-        bargap=0.0, # CHANGED: Remove space between bars
-        margin=dict(l=150, r=50, t=20, b=20), # Adjust margins
-        showlegend=False
+    # A two-bar chart does not need a headless browser: matplotlib's Agg renderer draws it directly.
+    # The figure is created without pyplot, so no global figure state is kept between calls.
+    fig = MplFigure(figsize=(7, 1.2), dpi=100)
+    ax = fig.add_subplot()
+    bars = ax.barh(y_labels, x_values, color=colors, height=0.8)
+    ax.bar_label(bars, labels=text_values, padding=3)
+    ax.set_xlim(0, 5)
+    ax.set_xticks([0, 1, 2, 3, 4, 5])
+    ax.set_xlabel(f"{min_label.split(':')[0].strip()} - {max_label.split(':')[0].strip()}")
+    ax.grid(axis='x')
+    ax.set_axisbelow(True)
+    ax.set_title(title)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    return buf.getvalue()
+
+# --- NEW: Function to render a single 0-5 value comparison as PNG bytes ---
+def create_single_value_comparison_plot(user_value, lecturer_value, title, min_label, max_label, lang_dict):
+    return _render_memoized(
+        render_comparison_plot_png,
+        user_value, lecturer_value, title, min_label, max_label,
+        lang_dict["user_answer_column_header"], lang_dict["lecturer_answer_column_header"]
     )
-    return fig
 
+# All report images are placed at the same width; python-docx derives the height from the PNG header
+REPORT_IMAGE_WIDTH = Inches(6.5)
 
-# --- Function to generate a report for a single student ---
-def generate_student_report(username_full, student_product_files, lecturer_solutions, lang_dict):
-    document = Document()
+# The default template is parsed once; each report starts from a deep copy, which is several times
+# cheaper than unpacking the template zip again. The base document itself is never modified.
+BASE_DOCUMENT = Document()
+
+def generate_student_report(username_full, student_product_files, lecturer_solutions, lang_dict, parsed_student_files=None):
+    document = copy.deepcopy(BASE_DOCUMENT)
+    # Looked up once; assigning a style by name searches the document's styles part for every table
+    table_grid_style = document.styles['Table Grid']
     document.add_heading(f"{lang_dict['report_title']} - {username_full}", level=1)
 
+    # Labels derived from the language strings are the same for every product, so they are split once per report
+    ai_role_row_label = lang_dict['ai_role_label'].split('(')[0].strip()
+    risk_title = lang_dict['risk_level_label'].split('(')[0].strip() # Title from label
+    risk_bounds = scale_bounds(lang_dict['risk_level_label']) # Min and max label
+    risk_description_row_label = lang_dict['risk_description_label'].split('(')[0].strip()
+    cl_aspects_row_label = lang_dict['continuous_learning_aspects_label'].split('(')[0].strip()
+    analytics_title = lang_dict['analytics_type_label'].split('(')[0].strip() # Title from label
+    analytics_bounds = scale_bounds(lang_dict['analytics_type_label']) # Min and max label
+    analytics_explanation_row_label = lang_dict['analytics_explanation_label'].split('(')[0].strip()
+
     for student_file_path in student_product_files:
-        try:
-            with open(student_file_path, "r", encoding="utf-8") as f:
-                student_data = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading student file {student_file_path}: {e}")
-            continue
+        # Files already parsed while grouping by username are not read a second time
+        student_data = parsed_student_files.pop(student_file_path, None) if parsed_student_files else None
+        if student_data is None:
+            try:
+                with open(student_file_path, "rb") as f:
+                    student_data = json_loads(f.read())
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error reading student file {student_file_path}: {e}")
+                continue
 
         product_name = student_data.get("product_name", "Unknown Product")
         lecturer_data = lecturer_solutions.get(product_name, {}) # Ensure it's a dict even if not found
+        # Nested sections are looked up once per product; the sections below read from these locals.
+        # 'or {}' also covers sections stored as null and only builds an empty dict when one is missing
+        user_risk_info = student_data.get('risk_of_adversarial_attacks') or {}
+        lecturer_risk_info = lecturer_data.get('risk_of_adversarial_attacks') or {}
+        user_cl_info = student_data.get('continuous_learning_feedback_loops') or {}
+        lecturer_cl_info = lecturer_data.get('continuous_learning_feedback_loops') or {}
 
         # --- Product Name ---
         document.add_paragraph(f"{lang_dict['product_label']}: {product_name}", style='Heading 2')
@@ -167,14 +175,14 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
         lecturer_ai_role = lecturer_data.get("ai_role", "N/A")
 
         # CHANGED: Use a table for AI embedding
-        table_ai_role = document.add_table(rows=1, cols=3)
-        table_ai_role.style = 'Table Grid'
+        table_ai_role = document.add_table(rows=2, cols=3) # Header + answer row, preallocated
+        table_ai_role.style = table_grid_style
         hdr_cells_ai_role = table_ai_role.rows[0].cells
         hdr_cells_ai_role[0].text = ""
         hdr_cells_ai_role[1].text = lang_dict['user_answer_column_header']
         hdr_cells_ai_role[2].text = lang_dict['lecturer_answer_column_header']
 
-        row_cells = table_ai_role.add_row().cells
+        row_cells = table_ai_role.rows[1].cells
         # Determine "Feature" or "Product" based on ai_role value
         if user_ai_role:
             user_display_role = lang_dict['ai_role_feature'] if "feature" in user_ai_role.lower() else lang_dict['ai_role_product']
@@ -182,27 +190,21 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
             user_display_role = "N/A"
         lecturer_display_role = lang_dict['ai_role_feature'] if "feature" in lecturer_ai_role.lower() else lang_dict['ai_role_product']
 
-        row_cells[0].text = lang_dict['ai_role_label'].split('(')[0].strip()
+        row_cells[0].text = ai_role_row_label
         row_cells[1].text = user_display_role
         row_cells[2].text = lecturer_display_role
         document.add_paragraph() # Spacer
 
         # --- UX4AI Spider Diagram ---
         document.add_heading(lang_dict['spider_diagram_label'], level=2)
-        user_scores_for_plot = student_data.get('scores', {})
-        solution_scores_for_plot = lecturer_data.get('scores', {})
-        fig_spider = create_report_spider_diagram(user_scores_for_plot, solution_scores_for_plot, lang_dict, product_name)
-        temp_spider_image_path = f"temp_spider_diagram_{username_full.replace(' ', '_')}_{product_name.replace(' ', '_')}.png"
-        fig_spider.write_image(temp_spider_image_path)
-        document.add_picture(temp_spider_image_path, width=Inches(6.5))
-        os.remove(temp_spider_image_path)
+        user_scores_for_plot = student_data.get('scores') or {}
+        solution_scores_for_plot = lecturer_data.get('scores') or {}
+        spider_png = create_report_spider_diagram(user_scores_for_plot, solution_scores_for_plot, lang_dict, product_name)
+        document.add_picture(io.BytesIO(spider_png), width=REPORT_IMAGE_WIDTH)
         
         # --- Legend for Spider Diagram ---
         document.add_heading(lang_dict['legend_label'], level=3)
-        legend_labels = [
-            'conversational', 'specialization', 'autonomy', 'accessibility', 'explainability'
-        ]
-        for label_key in legend_labels:
+        for label_key in SCORE_LABELS:
             p = document.add_paragraph()
             p.add_run(lang_dict[label_key + "_label"])
         document.add_paragraph() # Spacer
@@ -211,35 +213,31 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
         document.add_heading(lang_dict['risk_section_title_from_user'], level=2)
         document.add_paragraph(lang_dict['risk_level_info'])
         
-        user_risk_level = student_data.get('risk_of_adversarial_attacks', {}).get('level')
-        lecturer_risk_level = lecturer_data.get('risk_of_adversarial_attacks', {}).get('level')
+        user_risk_level = user_risk_info.get('level')
+        lecturer_risk_level = lecturer_risk_info.get('level')
 
-        fig_risk = create_single_value_comparison_plot(
+        risk_png = create_single_value_comparison_plot(
             user_risk_level, lecturer_risk_level,
-            lang_dict['risk_level_label'].split('(')[0].strip(), # Title from label
-            lang_dict['risk_level_label'].split('(')[1].split(',')[0].strip().replace(')', ''), # Min label
-            lang_dict['risk_level_label'].split('(')[1].split(',')[1].strip().replace(')', ''), # Max label
+            risk_title,
+            *risk_bounds,
             lang_dict
         )
-        temp_risk_image_path = f"temp_risk_plot_{username_full.replace(' ', '_')}_{product_name.replace(' ', '_')}.png"
-        fig_risk.write_image(temp_risk_image_path)
-        document.add_picture(temp_risk_image_path, width=Inches(6.5))
-        os.remove(temp_risk_image_path)
+        document.add_picture(io.BytesIO(risk_png), width=REPORT_IMAGE_WIDTH)
         document.add_paragraph() # Spacer
 
         # CHANGED: Table for only Risk Description
-        table_risk_desc = document.add_table(rows=1, cols=3)
-        table_risk_desc.style = 'Table Grid'
+        table_risk_desc = document.add_table(rows=2, cols=3) # Header + answer row, preallocated
+        table_risk_desc.style = table_grid_style
         hdr_cells_risk_desc = table_risk_desc.rows[0].cells
         hdr_cells_risk_desc[0].text = lang_dict['question_column_header']
         hdr_cells_risk_desc[1].text = lang_dict['user_answer_column_header']
         hdr_cells_risk_desc[2].text = lang_dict['lecturer_answer_column_header']
 
-        user_risk_desc = student_data.get('risk_of_adversarial_attacks', {}).get('description', "N/A")
-        lecturer_risk_desc = lecturer_data.get('risk_of_adversarial_attacks', {}).get('description', "N/A")
+        user_risk_desc = user_risk_info.get('description', "N/A")
+        lecturer_risk_desc = lecturer_risk_info.get('description', "N/A")
         
-        row_cells = table_risk_desc.add_row().cells
-        row_cells[0].text = lang_dict['risk_description_label'].split('(')[0].strip()
+        row_cells = table_risk_desc.rows[1].cells
+        row_cells[0].text = risk_description_row_label
         row_cells[1].text = str(user_risk_desc)
         row_cells[2].text = str(lecturer_risk_desc)
         document.add_paragraph() # Spacer
@@ -250,18 +248,18 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
         document.add_paragraph(lang_dict['continuous_learning_aspects_info'])
 
         # CHANGED: Table for only Continuous Learning Aspects
-        table_cl_aspects = document.add_table(rows=1, cols=3)
-        table_cl_aspects.style = 'Table Grid'
+        table_cl_aspects = document.add_table(rows=2, cols=3) # Header + answer row, preallocated
+        table_cl_aspects.style = table_grid_style
         hdr_cells_cl_aspects = table_cl_aspects.rows[0].cells
         hdr_cells_cl_aspects[0].text = lang_dict['question_column_header']
         hdr_cells_cl_aspects[1].text = lang_dict['user_answer_column_header']
         hdr_cells_cl_aspects[2].text = lang_dict['lecturer_answer_column_header']
 
-        cl_aspects_user = student_data.get('continuous_learning_feedback_loops', {}).get('aspects', "N/A")
-        cl_aspects_lecturer = lecturer_data.get('continuous_learning_feedback_loops', {}).get('aspects', "N/A")
+        cl_aspects_user = user_cl_info.get('aspects', "N/A")
+        cl_aspects_lecturer = lecturer_cl_info.get('aspects', "N/A")
         
-        row_cells = table_cl_aspects.add_row().cells
-        row_cells[0].text = lang_dict['continuous_learning_aspects_label'].split('(')[0].strip()
+        row_cells = table_cl_aspects.rows[1].cells
+        row_cells[0].text = cl_aspects_row_label
         row_cells[1].text = str(cl_aspects_user)
         row_cells[2].text = str(cl_aspects_lecturer)
         document.add_paragraph() # Spacer
@@ -269,35 +267,31 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
         # Analytics Type Level Plot
         document.add_paragraph(lang_dict['analytics_type_intro'])
 
-        user_analytics_level = student_data.get('continuous_learning_feedback_loops', {}).get('analytics_type_level')
-        lecturer_analytics_level = lecturer_data.get('continuous_learning_feedback_loops', {}).get('analytics_type_level')
+        user_analytics_level = user_cl_info.get('analytics_type_level')
+        lecturer_analytics_level = lecturer_cl_info.get('analytics_type_level')
 
-        fig_analytics = create_single_value_comparison_plot(
+        analytics_png = create_single_value_comparison_plot(
             user_analytics_level, lecturer_analytics_level,
-            lang_dict['analytics_type_label'].split('(')[0].strip(), # Title from label
-            lang_dict['analytics_type_label'].split('(')[1].split(',')[0].strip().replace(')', ''), # Min label
-            lang_dict['analytics_type_label'].split('(')[1].split(',')[1].strip().replace(')', ''), # Max label
+            analytics_title,
+            *analytics_bounds,
             lang_dict
         )
-        temp_analytics_image_path = f"temp_analytics_plot_{username_full.replace(' ', '_')}_{product_name.replace(' ', '_')}.png"
-        fig_analytics.write_image(temp_analytics_image_path)
-        document.add_picture(temp_analytics_image_path, width=Inches(6.5))
-        os.remove(temp_analytics_image_path)
+        document.add_picture(io.BytesIO(analytics_png), width=REPORT_IMAGE_WIDTH)
         document.add_paragraph() # Spacer
 
         # CHANGED: Table for only Analytics Explanation
-        table_analytics_expl = document.add_table(rows=1, cols=3)
-        table_analytics_expl.style = 'Table Grid'
+        table_analytics_expl = document.add_table(rows=2, cols=3) # Header + answer row, preallocated
+        table_analytics_expl.style = table_grid_style
         hdr_cells_analytics_expl = table_analytics_expl.rows[0].cells
         hdr_cells_analytics_expl[0].text = lang_dict['question_column_header']
         hdr_cells_analytics_expl[1].text = lang_dict['user_answer_column_header']
         hdr_cells_analytics_expl[2].text = lang_dict['lecturer_answer_column_header']
 
-        analytics_explanation_user = student_data.get('continuous_learning_feedback_loops', {}).get('analytics_type_explanation', "N/A")
-        analytics_explanation_lecturer = lecturer_data.get('continuous_learning_feedback_loops', {}).get('analytics_type_explanation', "N/A")
+        analytics_explanation_user = user_cl_info.get('analytics_type_explanation', "N/A")
+        analytics_explanation_lecturer = lecturer_cl_info.get('analytics_type_explanation', "N/A")
         
-        row_cells = table_analytics_expl.add_row().cells
-        row_cells[0].text = lang_dict['analytics_explanation_label'].split('(')[0].strip()
+        row_cells = table_analytics_expl.rows[1].cells
+        row_cells[0].text = analytics_explanation_row_label
         row_cells[1].text = str(analytics_explanation_user)
         row_cells[2].text = str(analytics_explanation_lecturer)
         document.add_paragraph() # Spacer
@@ -307,9 +301,30 @@ def generate_student_report(username_full, student_product_files, lecturer_solut
     # Save the document
     safe_username = username_full.replace(" ", "_").replace("/", "_")
     report_filename = os.path.join(REPORTS_DIR, f"{safe_username}_UX4AI_Report.docx")
-    document.save(report_filename)
+    buf = io.BytesIO()
+    document.save(buf)
+    write_file_atomic(report_filename, buf.getbuffer())
     print(f"Report generated for {username_full}: {report_filename}")
 
+# Each worker process writes the reports of its share of the students with its own Kaleido browser,
+# so the browser start-up is paid once per worker rather than once per report.
+# A failing report is logged and skipped so the rest of the batch is still written; the names of the
+# failed students are returned.
+def generate_report_batch(jobs, lecturer_solutions, lang_dict):
+    failed = []
+    server_started = start_image_export()
+    try:
+        for username, product_files, parsed_student_files in jobs:
+            try:
+                generate_student_report(username, product_files, lecturer_solutions, lang_dict, parsed_student_files)
+            except Exception as e:
+                print(f"Error generating report for {username}: {e!r}")
+                failed.append(username)
+        return failed
+    finally:
+        if server_started:
+            stop_image_export()
+
 # --- Main execution logic ---
 if __name__ == "__main__":
     # You can change 'en' to 'de' or any other language code you have
@@ -317,43 +332,46 @@ if __name__ == "__main__":
     current_lang_dict = load_lang_file(report_language)
 
     # Load all lecturer solutions once
-    lecturer_solutions_by_product = {}
-    for filename in os.listdir(SOLUTION_DIR):
-        if filename.endswith(".json"):
-            temp_product_name = filename.replace(".json", "").replace("_", " ").title()
-            solution_data = load_solution_data(temp_product_name)
-            if solution_data and solution_data.get("product_name"):
-                 lecturer_solutions_by_product[solution_data["product_name"]] = solution_data
-            elif solution_data:
-                lecturer_solutions_by_product[temp_product_name] = solution_data
-
-    # Group student data by username
-    student_data_grouped = defaultdict(list)
+    lecturer_solutions_by_product = load_lecturer_solutions()
+
+    # Group student data by username; files parsed for the username are kept for report generation
+    student_data_grouped = {}
+    parsed_student_files = {}
     if os.path.exists(DATA_DIR):
-        for user_dir in os.listdir(DATA_DIR):
-            user_path = os.path.join(DATA_DIR, user_dir)
-            if os.path.isdir(user_path):
-                user_formatted_name_from_folder = user_dir
-                full_username_for_report = user_dir
-
-                for filename in os.listdir(user_path):
-                    if filename.endswith(".json"):
-                        file_path = os.path.join(user_path, filename)
-                        student_data_grouped[user_formatted_name_from_folder].append(file_path)
-                        
-                        if full_username_for_report == user_dir:
-                            try:
-                                with open(file_path, "r", encoding="utf-8") as f:
-                                    data = json.load(f)
-                                    if data.get("username"): 
-                                        full_username_for_report = data["username"] 
-                            except:
-                                pass
-
-                if student_data_grouped[user_formatted_name_from_folder]:
-                    student_data_grouped[full_username_for_report] = student_data_grouped.pop(user_formatted_name_from_folder)
-
-
-    for username, product_files in student_data_grouped.items():
-        if product_files:
-            generate_student_report(username, product_files, lecturer_solutions_by_product, current_lang_dict)
\ No newline at end of file
+        # DirEntry.is_dir reuses the file type from the directory listing instead of a stat per entry;
+        # each listing is closed before its files are read
+        with os.scandir(DATA_DIR) as it:
+            user_folders = [(user_entry.name, user_entry.path) for user_entry in it if user_entry.is_dir(follow_symlinks=False)]
+        for folder_name, user_path in user_folders:
+            with os.scandir(user_path) as it:
+                product_files = [file_entry.path for file_entry in it if file_entry.name.endswith(".json")]
+            if not product_files:
+                continue
+
+            # The report is named after the username stored in the submissions, falling back to the folder name
+            full_username_for_report = folder_name
+            for file_path in product_files:
+                try:
+                    with open(file_path, "rb") as f:
+                        data = json_loads(f.read())
+                    parsed_student_files[file_path] = data
+                    if data.get("username"):
+                        full_username_for_report = data["username"]
+                        break
+                except:
+                    pass
+
+            student_data_grouped[full_username_for_report] = product_files
+
+    # Reports are independent per student, so they are written in parallel
+    report_jobs = [(username, product_files, {path: parsed_student_files[path] for path in product_files if path in parsed_student_files})
+                   for username, product_files in student_data_grouped.items()]
+    if report_jobs:
+        n_workers = min(REPORT_WORKERS, len(report_jobs))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            batches = [report_jobs[i::n_workers] for i in range(n_workers)]
+            # Iterating the results surfaces exceptions raised outside the per-student reports
+            failed_students = [username for batch_failed in executor.map(generate_report_batch, batches, [lecturer_solutions_by_product] * n_workers, [current_lang_dict] * n_workers)
+                               for username in batch_failed]
+        if failed_students:
+            print(f"No report written for {len(failed_students)} student(s): {', '.join(failed_students)}")
\ No newline at end of file
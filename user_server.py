@@ -1,9 +1,24 @@
 import gradio as gr
-import plotly.graph_objects as go
-import numpy as np
-import pandas as pd
+import functools
 import json
 import os
+import re
+import threading
+
+# orjson parses and serializes UTF-8 bytes directly and is considerably faster than the stdlib,
+# whose indented output goes through the pure-Python pretty-printer.
+# Submissions are written compact; set UX4AI_PRETTY_JSON=1 to keep them indented for reading by hand.
+PRETTY_JSON = os.environ.get("UX4AI_PRETTY_JSON") == "1"
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+except ImportError:
+    _json_loads = json.loads
+    if PRETTY_JSON:
+        _json_dumps = lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        _json_dumps = lambda obj: json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
 
 # --- Language setup ---
 LANG_DIR = "./lang"
@@ -12,29 +27,30 @@ DEFAULT_LANG = "en"
 # CHANGED: Removed direct dictionary definitions (LANG_EN, LANG_DE)
 # The dictionaries will now be loaded from JSON files.
 
+# Each language file is parsed at most once per (path, mtime), so toggling EN/DE is a cache hit
+# while edits to a language file are still picked up. The cached dicts are shared, callers only read them.
+# The raw bytes go straight to the parser, skipping the separate UTF-8 decode into a str.
+@functools.lru_cache(maxsize=8)
+def _load_lang_cached(file_path, mtime_ns):
+    with open(file_path, "rb") as f:
+        return _json_loads(f.read())
+
 def load_lang_file(lang_code):
     # CHANGED: Load language dictionary from the specified JSON files in LANG_DIR.
-    file_path = os.path.join(LANG_DIR, f"{lang_code}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Language file not found for '{lang_code}'. Falling back to default.")
-        # Fallback to English if the requested language file is not found
-        default_file_path = os.path.join(LANG_DIR, f"{DEFAULT_LANG}.json")
-        with open(default_file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from '{file_path}'. Falling back to default.")
-        # Fallback to English if the JSON is malformed
-        default_file_path = os.path.join(LANG_DIR, f"{DEFAULT_LANG}.json")
-        with open(default_file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    # Try the requested language, then fall back to the default (English) once.
+    for code in dict.fromkeys((lang_code, DEFAULT_LANG)):
+        file_path = os.path.join(LANG_DIR, f"{code}.json")
+        try:
+            return _load_lang_cached(file_path, os.stat(file_path).st_mtime_ns)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not load language file for '{code}': {e}")
+    raise RuntimeError(f"No usable language file for '{lang_code}' or the default '{DEFAULT_LANG}' in {LANG_DIR}")
 
 
 # CHANGED: Initialized LANG by loading from the default English JSON file.
 # This ensures LANG is populated from the file system at startup.
 LANG = load_lang_file(DEFAULT_LANG)
+load_lang_file("de") # Warm the cache so the first language switch does not parse JSON
 
 # --- Product Data ---
 # CHANGED: Renamed 'personalization' key to 'specialization' in all product default_scores.
@@ -48,67 +64,147 @@ PRODUCTS = {
     "Copilot": {"description": "Microsoft's AI companion that helps with various tasks across different applications.", "url": "https://copilot.microsoft.com/", "default_scores": {"conversational": 4.0, "specialization": 4.2, "autonomy": 4.0, "accessibility": 4.7, "explainability": 3.0}},
     "Other": {"description": "Please specify the product name below.", "url": "", "default_scores": {}}
 }
+PRODUCT_CHOICES = list(PRODUCTS)
 
 # --- Function to update product info and reset sliders ---
+# Only the text inside the wrapper changes between products; the markup is filled in with one format call
+_PRODUCT_HTML_TMPL = '<div style="border: none; background-color: transparent; padding: 0; margin: 0;">{prefix}{description}{suffix}</div>'
+
+# The info box is the same for every load of a product in a given language, so it is rendered once
+@functools.lru_cache(maxsize=None)
+def render_product_info_html(selected_product, prefix, suffix_template):
+    product_data = PRODUCTS[selected_product]
+    return _PRODUCT_HTML_TMPL.format(
+        prefix=prefix,
+        description=product_data["description"],
+        suffix=suffix_template.format(url=product_data["url"])
+    )
+
+# Cached update tuples are handed out through fresh_updates: Gradio pops "value" out of update dicts
+# while applying them, so every call needs its own shallow copies
+def fresh_updates(updates):
+    return tuple(update.copy() for update in updates)
+
+# Loading a product resets the form to the same values every time, for any product
+_RESET_UPDATES = (
+    gr.update(value=2.5), # Conversational
+    gr.update(value=2.5), # Specialization # CHANGED: Updated comment
+    gr.update(value=2.5), # Autonomy
+    gr.update(value=2.5), # Accessibility
+    gr.update(value=2.5), # Explainability
+    gr.update(value=None), # AI Role Radio
+    gr.update(value=2.5), # Risk level slider
+    gr.update(value=""),  # Clear risk description textbox
+    gr.update(value=2.5), # Continuous learning analytics type slider
+    gr.update(value=""),  # Clear continuous learning aspects textbox
+    gr.update(value=""),  # Clear continuous learning explanation textbox
+    gr.update(visible=False)
+)
+
 # CHANGED: Renamed 'personalization' parameter to 'specialization'.
 def update_product_info(selected_product, current_lang_dict):
     if selected_product in PRODUCTS:
-        product_data = PRODUCTS[selected_product]
-        description = product_data["description"]
-        url = product_data["url"]
-
-        html_content = f"""
-        <div style="border: none; background-color: transparent; padding: 0; margin: 0;">
-            {current_lang_dict["product_description_prefix"]}{description}{current_lang_dict["product_description_suffix"].format(url=url)}
-        </div>
-        """
-        return (
-            html_content,
-            gr.update(value=2.5), # Conversational
-            gr.update(value=2.5), # Specialization # CHANGED: Updated comment
-            gr.update(value=2.5), # Autonomy
-            gr.update(value=2.5), # Accessibility
-            gr.update(value=2.5), # Explainability
-            gr.update(value=None), # AI Role Radio
-            gr.update(value=2.5), # Risk level slider
-            gr.update(value=""),  # Clear risk description textbox
-            gr.update(value=2.5), # Continuous learning analytics type slider
-            gr.update(value=""),  # Clear continuous learning aspects textbox
-            gr.update(value=""),  # Clear continuous learning explanation textbox
-            gr.update(visible=False)
+        html_content = render_product_info_html(
+            selected_product,
+            current_lang_dict["product_description_prefix"],
+            current_lang_dict["product_description_suffix"]
         )
-    return (
-        "", gr.update(value=2.5), gr.update(value=2.5), gr.update(value=2.5),
-        gr.update(value=2.5), gr.update(value=2.5), gr.update(value=None),
-        gr.update(value=2.5), gr.update(value=""), gr.update(value=2.5),
-        gr.update(value=""), gr.update(value=""), gr.update(visible=False)
-    )
+    else:
+        html_content = ""
+    return (html_content,) + fresh_updates(_RESET_UPDATES)
 
 # --- Function to handle dropdown selection ---
-def handle_product_selection(selected_product):
-    if selected_product == "Other":
-        return gr.update(visible=True), gr.update(visible=True)
-    elif selected_product:
-        return gr.update(visible=False), gr.update(visible=True)
-    return gr.update(visible=False), gr.update(visible=False)
+# Runs in the browser: it only toggles visibility, so the dropdown needs no server round trip.
+# "Other" shows the product name box and the load button, any other product only the button.
+PRODUCT_SELECTION_JS = """
+(selected_product) => [
+    {__type__: "update", visible: selected_product === "Other"},
+    {__type__: "update", visible: !!selected_product}
+]
+"""
 
 # --- Function to generate the spider diagram using Plotly ---
+# The five UX4AI dimensions in slider order; doubles as the score keys and the "<name>_label" lang keys
+DIM_NAMES = ("conversational", "specialization", "autonomy", "accessibility", "explainability")
+
+# The figure skeleton never changes, only r, theta and the labels do; building from plain dicts with
+# _validate=False skips re-validating that fixed part on every redraw
+_SPIDER_LAYOUT_TEMPLATE = {
+    'polar': {'radialaxis': {'visible': True, 'range': [0, 5]}},
+    'showlegend': True,
+    'height': 600
+}
+
+# Axis labels only depend on the language strings, so they are split once per language
+@functools.lru_cache(maxsize=None)
+def spider_labels(label_texts):
+    # Keep just the main label part, dropping the description in parentheses
+    return tuple(text.split('(')[0].strip() for text in label_texts)
+
+# Figures are memoized on the slider values and the label texts, so dragging a slider back and forth
+# returns already built figures. Keyed on content rather than id(): gr.State hands every session its
+# own copy of the language dict. The cached figure is shared between sessions; gr.Plot only
+# serializes it, so it is never modified after being built.
+@functools.lru_cache(maxsize=256)
+def _spider_figure(values, labels, diagram_label):
+    # Imported on first use so starting the server does not wait on plotly
+    import plotly.graph_objects as go
+    return go.Figure({
+        'data': [{'type': 'scatterpolar', 'r': list(values), 'theta': list(labels), 'fill': 'toself', 'name': diagram_label}],
+        'layout': {**_SPIDER_LAYOUT_TEMPLATE, 'title': {'text': diagram_label}}
+    }, _validate=False)
+
 # CHANGED: Renamed 'personalization' parameter to 'specialization'.
 def create_spider_diagram_plotly(conversational, specialization, autonomy, accessibility, explainability, current_lang_dict):
-    labels = [
-        current_lang_dict['conversational_label'].split('(')[0].strip(),
-        current_lang_dict['specialization_label'].split('(')[0].strip(), # CHANGED: Used specialization_label
-        current_lang_dict['autonomy_label'].split('(')[0].strip(),
-        current_lang_dict['accessibility_label'].split('(')[0].strip(),
-        current_lang_dict['explainability_label'].split('(')[0].strip()
-    ]
-    values = [conversational, specialization, autonomy, accessibility, explainability] # CHANGED: Used specialization
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(r=values, theta=labels, fill='toself', name=current_lang_dict['spider_diagram_label']))
-    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 5])), showlegend=True, title=current_lang_dict['spider_diagram_label'], height=600)
-    return fig
+    labels = spider_labels(tuple(current_lang_dict[name + '_label'] for name in DIM_NAMES))
+    # The sliders move in 0.1 steps; rounding drops float noise so equal positions share a cache entry
+    values = tuple(round(value, 1) for value in (conversational, specialization, autonomy, accessibility, explainability)) # CHANGED: Used specialization
+    return _spider_figure(values, labels, current_lang_dict['spider_diagram_label'])
+
+# --- Submission writes ---
+# Each submission is written before the handler answers, so the success message is only shown for data
+# that reached the disk. The bytes go to a temp file next to the target which then replaces it, so a crash
+# mid-write never leaves a truncated submission behind. A submission identical to what this process last
+# wrote to the same file is not written again.
+DATA_DIR = "./data"
+_LAST_WRITTEN = {}
+# O_BINARY only exists on Windows, where fds otherwise default to text mode and rewrite '\n' as '\r\n'
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+# Held for the whole write, so concurrent submits of the same file cannot leave _LAST_WRITTEN out of date
+_WRITE_LOCK = threading.Lock()
+
+def write_submission(file_path, json_output_bytes):
+    with _WRITE_LOCK:
+        if _LAST_WRITTEN.get(file_path) == json_output_bytes:
+            return
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        # The payload is already UTF-8 bytes; a raw fd skips the buffered file object around one write.
+        # The user directory is only created when the open fails for lack of it, i.e. on a first submit.
+        try:
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+        try:
+            try:
+                os.write(fd, json_output_bytes)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _LAST_WRITTEN[file_path] = json_output_bytes
 
 # --- Function to capture all data and save it to file ---
+# At least two whitespace-separated words of letters only, checked in one pass of the regex engine
+_FULL_NAME_RE = re.compile(r"[^\W\d_]+(?:\s+[^\W\d_]+)+")
+# Spaces and slashes in product names become underscores in the file name, in one pass
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+
 # CHANGED: Renamed 'personalization' parameter to 'specialization'.
 def capture_all_data(
     username_full,
@@ -124,10 +220,10 @@ def capture_all_data(
     current_lang_dict
 ):
     # Username Validation and Formatting
-    username_parts = username_full.strip().split()
-    if len(username_parts) < 2 or not all(part.isalpha() for part in username_parts):
+    if not _FULL_NAME_RE.fullmatch(username_full.strip()):
         return "", current_lang_dict["error_full_name"]
-    
+    username_parts = username_full.split()
+
     formatted_username = username_parts[0][0].upper() + username_parts[-1].capitalize()
 
     # Product Name Logic
@@ -144,13 +240,7 @@ def capture_all_data(
         "username": formatted_username,
         "product_name": product_name_to_save,
         "ai_role": ai_role,
-        "scores": {
-            "conversational": conversational,
-            "specialization": specialization, # CHANGED: Renamed
-            "autonomy": autonomy,
-            "accessibility": accessibility,
-            "explainability": explainability
-        },
+        "scores": dict(zip(DIM_NAMES, (conversational, specialization, autonomy, accessibility, explainability))),
         "risk_of_adversarial_attacks": {
             "level": risk_level,
             "description": risk_assessment_description
@@ -162,20 +252,16 @@ def capture_all_data(
         }
     }
 
-    # Convert the data to a JSON string
-    json_output_string = json.dumps(analysis_data, indent=4)
+    # Convert the data to UTF-8 encoded JSON
+    json_output_bytes = _json_dumps(analysis_data)
 
     # --- File Saving Logic ---
     try:
-        safe_product_name = product_name_to_save.lower().replace(" ", "_").replace("/", "_")
-        base_data_dir = "./data"
-        user_data_dir = os.path.join(base_data_dir, formatted_username)
-        os.makedirs(user_data_dir, exist_ok=True)
-        file_path = os.path.join(user_data_dir, f"{safe_product_name}.json")
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(json_output_string)
-            
+        safe_product_name = product_name_to_save.lower().translate(_SAFE_NAME_TABLE)
+        file_path = os.path.join(DATA_DIR, formatted_username, f"{safe_product_name}.json")
+
+        write_submission(file_path, json_output_bytes)
+
         success_message = f"{current_lang_dict['success_message_prefix']} {file_path}"
         return success_message, current_lang_dict["success_message_suffix"]
         
@@ -184,9 +270,7 @@ def capture_all_data(
         return "", f"{current_lang_dict['error_submit_data_prefix']} {e}"
 
 # --- Language Update Function ---
-def update_ui_text(lang_code):
-    new_lang_dict = load_lang_file(lang_code)
-
+def build_ui_updates(new_lang_dict):
     return (
         gr.update(value=f"<h1 style='display: inline;'>{new_lang_dict['app_title']}</h1>"),
         gr.update(label=new_lang_dict["username_label"], info=new_lang_dict["username_info"], placeholder=new_lang_dict["username_placeholder"]),
@@ -213,10 +297,20 @@ def update_ui_text(lang_code):
         gr.update(value=new_lang_dict["submit_button"]),
         gr.update(label=new_lang_dict["spider_diagram_label"]),
         gr.update(label=new_lang_dict["data_submitted_label"]),
-        gr.update(label=new_lang_dict["status_label"]),
-        new_lang_dict
+        gr.update(label=new_lang_dict["status_label"])
     )
 
+# The updates only depend on the language dict, so they are built once per loaded language file.
+# load_lang_file hands out the same dict until the file changes, which retires the cached entry.
+_UI_UPDATE_CACHE = {}
+
+def update_ui_text(lang_code):
+    new_lang_dict = load_lang_file(lang_code)
+    cached = _UI_UPDATE_CACHE.get(lang_code)
+    if cached is None or cached[0] is not new_lang_dict:
+        cached = _UI_UPDATE_CACHE[lang_code] = (new_lang_dict, build_ui_updates(new_lang_dict))
+    return fresh_updates(cached[1]) + (new_lang_dict,)
+
 
 # --- Gradio Interface ---
 with gr.Blocks(title="UX4AI Workshop") as app:
@@ -239,7 +333,7 @@ with gr.Blocks(title="UX4AI Workshop") as app:
             )
 
             product_dropdown = gr.Dropdown(
-                choices=list(PRODUCTS.keys()),
+                choices=PRODUCT_CHOICES,
                 label=LANG["product_dropdown_label"],
                 info=LANG["product_dropdown_info"]
             )
@@ -316,9 +410,10 @@ with gr.Blocks(title="UX4AI Workshop") as app:
 
     # --- Event Handling ---
     product_dropdown.change(
-        fn=handle_product_selection,
+        fn=None,
         inputs=[product_dropdown],
-        outputs=[other_product_name_input, load_product_btn]
+        outputs=[other_product_name_input, load_product_btn],
+        js=PRODUCT_SELECTION_JS
     )
 
     load_product_btn.click(
@@ -339,12 +434,16 @@ with gr.Blocks(title="UX4AI Workshop") as app:
 
     # CHANGED: Renamed 'personalization' to 'specialization' in the sliders list.
     sliders = [conversational, specialization, autonomy, accessibility, explainability]
-    for slider in sliders:
-        slider.change(
-            fn=create_spider_diagram_plotly,
-            inputs=sliders + [current_lang_state],
-            outputs=plotly_chart_output
-        )
+    # .change also fires for typed and keyboard edits and for the reset when a product is loaded.
+    # Changes arriving while a redraw is running collapse into one for the latest slider values.
+    gr.on(
+        triggers=[slider.change for slider in sliders],
+        fn=create_spider_diagram_plotly,
+        inputs=sliders + [current_lang_state],
+        outputs=plotly_chart_output,
+        trigger_mode="always_last",
+        show_progress="hidden"
+    )
 
     capture_data_btn.click(
         fn=capture_all_data,
@@ -0,0 +1,140 @@
+import functools
+import json
+import os
+
+# Helpers shared by the report scripts (generate_summary_report.py, per_student_report.py) and the dashboard.
+# orjson parses bytes directly and is considerably faster than the stdlib parser; every module that
+# reads or writes JSON goes through json_loads/json_dumps. orjson's JSONDecodeError subclasses
+# json.JSONDecodeError, so handlers catching the stdlib error work for both.
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = lambda obj: json.dumps(obj).encode("utf-8")
+
+# Writes go to a temporary file next to the target which is then renamed over it, so readers (the
+# dashboard, the PDF converter, the next run) never see a half-written file
+def write_file_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+SCORE_LABELS = ('conversational', 'specialization', 'autonomy', 'accessibility', 'explainability')
+
+# --- Language setup ---
+LANG_DIR = "./lang"
+DEFAULT_LANG = "en" # Default language for reports
+
+# Cached: each language file (including the default fallback) is read once per run
+@functools.lru_cache(maxsize=None)
+def load_lang_file(lang_code):
+    file_path = os.path.join(LANG_DIR, f"{lang_code}.json")
+    try:
+        with open(file_path, "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        print(f"Warning: Language file not found for '{lang_code}'. Falling back to default.")
+        if lang_code == DEFAULT_LANG:
+            raise FileNotFoundError(f"Default language file '{DEFAULT_LANG}.json' also not found.")
+        return load_lang_file(DEFAULT_LANG)
+    except json.JSONDecodeError:
+        print(f"Error decoding JSON for '{lang_code}', falling back to default.")
+        if lang_code == DEFAULT_LANG:
+            raise json.JSONDecodeError(f"Default language file '{DEFAULT_LANG}.json' is malformed.", doc="", pos=0)
+        return load_lang_file(DEFAULT_LANG)
+
+# Shared part of the report spider figure layout, built once. Figures are built from plain dicts with
+# _validate=False: the inputs are small fixed-shape values, so plotly's schema validation is pure overhead.
+SPIDER_LAYOUT_TEMPLATE = {
+    'polar': {'radialaxis': {'visible': True, 'range': [0, 5]}},
+    'showlegend': True,
+    'height': 400,
+    'margin': {'l': 50, 'r': 50, 't': 70, 'b': 50}
+}
+
+# --- Min/max captions of a 0-5 scale label, e.g. "Analytics Type (0: Manual Analytics, 5: AI-driven Analytics)" ---
+def scale_bounds(label_text):
+    bounds = label_text.split('(')[1].split(',')
+    return bounds[0].strip().replace(')', ''), bounds[1].strip().replace(')', '')
+
+SOLUTION_DIR = "./solutions"
+
+# --- Helper to load solution data ---
+# Takes the path found by the solutions scan, so no file name is rebuilt from the product name
+# and no extra existence check is needed. Cached per path; each solution file is parsed once.
+@functools.lru_cache(maxsize=None)
+def load_solution_data(solution_path):
+    try:
+        with open(solution_path, "rb") as f:
+            return json_loads(f.read())
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error reading solution file {solution_path}: {e}")
+    return None
+
+# --- Load all lecturer solutions, cached across runs ---
+# The cache is reused while the solution files' names, mtimes and sizes are unchanged.
+CACHE_DIR = "./cache"
+SOLUTIONS_CACHE_PATH = os.path.join(CACHE_DIR, "lecturer_solutions.json")
+
+def load_lecturer_solutions():
+    with os.scandir(SOLUTION_DIR) as it:
+        solution_entries = sorted((entry for entry in it if entry.name.endswith(".json") and entry.is_file()),
+                                  key=lambda entry: entry.name)
+    fingerprint = [[entry.name, entry.stat().st_mtime_ns, entry.stat().st_size] for entry in solution_entries]
+    try:
+        with open(SOLUTIONS_CACHE_PATH, "rb") as f:
+            cached = json_loads(f.read())
+        if cached.get("fingerprint") == fingerprint:
+            return cached["solutions"]
+    except (json.JSONDecodeError, IOError, AttributeError, KeyError):
+        pass
+
+    lecturer_solutions_by_product = {}
+    for solution_entry in solution_entries:
+        solution_data = load_solution_data(solution_entry.path)
+        if solution_data and solution_data.get("product_name"):
+             lecturer_solutions_by_product[solution_data["product_name"]] = solution_data
+        elif solution_data:
+            # Fall back to a name derived from the file name, only built when the file has none
+            temp_product_name = solution_entry.name.replace(".json", "").replace("_", " ").title()
+            lecturer_solutions_by_product[temp_product_name] = solution_data
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_file_atomic(SOLUTIONS_CACHE_PATH, json_dumps({"fingerprint": fingerprint, "solutions": lecturer_solutions_by_product}))
+    except OSError as e:
+        print(f"Could not write solutions cache {SOLUTIONS_CACHE_PATH}: {e}")
+    return lecturer_solutions_by_product
+
+# Every worker process runs its own headless browser for the image export, so the pool stays small
+# by default; set UX4AI_REPORT_WORKERS to change it
+REPORT_WORKERS = max(1, int(os.environ.get("UX4AI_REPORT_WORKERS", min(4, os.cpu_count() or 1))))
+
+# --- Keep one Kaleido browser alive for all image exports ---
+# Kaleido >= 1.1 otherwise launches a fresh browser for every write_image call; older Kaleido
+# versions keep their own persistent subprocess and don't have this API.
+def start_image_export():
+    try:
+        import kaleido
+    except ImportError:
+        return False
+    if not hasattr(kaleido, "start_sync_server"):
+        return False
+    # The charts contain no LaTeX, so MathJax (fetched from a CDN by default) is not loaded at all;
+    # plotly.js is already taken from the local plotly package
+    kaleido.start_sync_server(mathjax=False, silence_warnings=True)
+    return True
+
+def stop_image_export():
+    import kaleido
+    kaleido.stop_sync_server(silence_warnings=True)